@@ -1,8 +1,10 @@
-import json
+import json, sys, pathlib
 from collections import defaultdict
 from statistics import mean
 from math_functions.statistics_analysis import statistics_calc
 from math_functions.ranking_functions import rank_value, rank_value_skewed
+sys.path.insert(1, str(pathlib.Path(__file__).parent.parent.parent))
+from runtime.utilities.rank_codes import median_rank_codes, natural_disaster_rank_codes, missing_rank_code, encode_rank
 
 """
     Rank the Natural Disaster Processed Data & Store Results in JSON
@@ -114,11 +116,13 @@ for state, disaster_events in state_disaster_data.items():
     frequency_deviation_ratio = (frequency - all_disaster_results['Median_Frequency_Per_State']) / all_disaster_results['MAD_Frequency_Per_State']
     frequency_rank = rank_value(deviation_ratio=frequency_deviation_ratio)
 
-    # Store Relative Rank for Nationwide Data
+    # Store Relative Rank for Nationwide Data - Ordinal Codes Stored for Runtime Scoring
     state_disaster_results[state].append(
         {
             'All_Severity_Rank': severity_rank,
-            'All_Frequency_Rank': frequency_rank
+            'All_Frequency_Rank': frequency_rank,
+            'All_Severity_Code': encode_rank(severity_rank, natural_disaster_rank_codes),
+            'All_Frequency_Code': encode_rank(frequency_rank, median_rank_codes)
         }
     )
 
@@ -161,21 +165,46 @@ for state, disaster_events in state_disaster_data.items():
             frequency_deviation_ratio = (frequency - disaster_by_type_results[disaster_type]['Median_Frequency_Per_State']) / disaster_by_type_results[disaster_type]['MAD_Frequency_Per_State']
             frequency_rank = rank_value(deviation_ratio=frequency_deviation_ratio)
 
-        # Store Relative Rank for Disaster Type Data
+        # Store Relative Rank for Disaster Type Data - Ordinal Codes Stored for Runtime Scoring
         state_disaster_results[state].append(
             {
                 f'{disaster_type}_Severity_Rank': severity_rank,
-                f'{disaster_type}_Frequency_Rank': frequency_rank
+                f'{disaster_type}_Frequency_Rank': frequency_rank,
+                f'{disaster_type}_Severity_Code': encode_rank(severity_rank, natural_disaster_rank_codes),
+                f'{disaster_type}_Frequency_Code': encode_rank(frequency_rank, median_rank_codes)
             }
         )
     
 
+
+### Dense State x Disaster Type x (Severity, Frequency) Rank Code Matrix for Runtime Scoring
+
+# Combined Natural Disaster Data First, then Each Disaster Type
+disaster_types = ['All', *sorted({key[:-len('_Severity_Code')] for state_results in state_disaster_results.values() for results in state_results for key in results if key.endswith('_Severity_Code')} - {'All'})]
+
+state_disaster_rank_codes = []
+for state, state_results in state_disaster_results.items():
+    # Merge the Single Disaster Type Dictionaries of the State
+    merged_results = {key: value for results in state_results for key, value in results.items()}
+    # No Record of the Disaster Type in the State: Missing Code for Both Severity & Frequency
+    state_disaster_rank_codes.append([[merged_results.get(f'{disaster_type}_Severity_Code', missing_rank_code), merged_results.get(f'{disaster_type}_Frequency_Code', missing_rank_code)] for disaster_type in disaster_types])
+
+state_disaster_rank_matrix = {
+    'States': [*state_disaster_results.keys()],
+    'Disaster_Types': disaster_types,
+    'Rank_Codes': state_disaster_rank_codes
+}
+
 # ---------------------------------------------------------------------------   
 
 # Save Results Dictionary as JSON File
 with open(f"data/data_ranking/ranked_data/State_Natural_Disaster_Ranked_Data.json", 'w') as f:
     json.dump(state_disaster_results, f)
 
+# Save Rank Code Matrix as JSON File
+with open(f"data/data_ranking/ranked_data/State_Natural_Disaster_Rank_Matrix.json", 'w') as f:
+    json.dump(state_disaster_rank_matrix, f)
+
 
 
 
@@ -1,7 +1,9 @@
-import json
+import json, sys, pathlib
 from collections import defaultdict
 from math_functions.statistics_analysis import statistics_calc
 from math_functions.ranking_functions import rank_value
+sys.path.insert(1, str(pathlib.Path(__file__).parent.parent.parent))
+from runtime.utilities.rank_codes import median_rank_codes, encode_rank
 
 """
     Rank the Weather Data & Store Results in JSON
@@ -48,10 +50,12 @@ for zipcode_prefix, weather_data in zipcode_weather_data.items():
     sunshine_deviation_ratio = (sunshine_minutes - all_weather_results['Median_Yearly_Sunshine']) / all_weather_results['MAD_Yearly_Sunshine']
     sunshine_rank = rank_value(deviation_ratio=sunshine_deviation_ratio)
 
-    # Update Weather Data
+    # Update Weather Data - Ordinal Codes Stored for Runtime Scoring
     weather_data.update({
         'Yearly_Precipitation': precipitation_rank,
-        'Yearly_Sunshine': sunshine_rank
+        'Yearly_Sunshine': sunshine_rank,
+        'Yearly_Precipitation_Code': encode_rank(precipitation_rank, median_rank_codes),
+        'Yearly_Sunshine_Code': encode_rank(sunshine_rank, median_rank_codes)
     })
     
     zip_code_weather_results.update({zipcode_prefix:weather_data})
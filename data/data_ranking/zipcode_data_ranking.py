@@ -1,7 +1,9 @@
-import json
+import json, sys, pathlib
 from collections import defaultdict
 from math_functions.statistics_analysis import statistics_calc
 from math_functions.ranking_functions import rank_value, rank_value_skewed
+sys.path.insert(1, str(pathlib.Path(__file__).parent.parent.parent))
+from runtime.utilities.rank_codes import median_rank_codes, skewed_rank_codes, area_classification_codes, encode_rank
 
 """
     Rank the Zipcode Data & Store Results in JSON
@@ -91,7 +93,7 @@ for city, city_metrics in city_metrics_data.items():
     motor_vehicle_rank = rank_value(deviation_ratio=motor_vehicle_deviation_ratio) if motor_vehicle else None
 
     public_transportation_deviation_ratio = (public_transportation - all_zipcode_results['Mean_Public_Transportation_Work_Percentage']) / all_zipcode_results['Standard_Deviation_Public_Transportation_Work_Percentage'] if public_transportation else None
-    public_transportationt_rank = rank_value_skewed(deviation_ratio=public_transportation_deviation_ratio) if public_transportation else None
+    public_transportation_rank = rank_value_skewed(deviation_ratio=public_transportation_deviation_ratio) if public_transportation else None
 
     walking_biking_deviation_ratio = (walking_biking - all_zipcode_results['Mean_Walking_Biking_Work_Percentage']) / all_zipcode_results['Standard_Deviation_Walking_Biking_Work_Percentage'] if walking_biking else None
     walking_biking_rank = rank_value_skewed(deviation_ratio=walking_biking_deviation_ratio) if walking_biking else None
@@ -108,6 +110,19 @@ for city, city_metrics in city_metrics_data.items():
         'Walking_Biking_Work_Percentage': walking_biking_rank
     })
 
+    # Ordinal Codes Stored for Runtime Scoring
+    city_metrics.update({
+        'Married_Percentage_Code': encode_rank(married_percent_rank, median_rank_codes),
+        'Families_with_Children_Code': encode_rank(families_with_children_rank, median_rank_codes),
+        'Home_Occupancy_Code': encode_rank(home_occupancy_rank, median_rank_codes),
+        'Employment_Percentage_Code': encode_rank(employment_percent_rank, median_rank_codes),
+        'School_Enrollment_Percentage_Code': encode_rank(school_enrollment_rank, median_rank_codes),
+        'Motor_Vehicle_Work_Percentage_Code': encode_rank(motor_vehicle_rank, median_rank_codes),
+        'Public_Transportation_Work_Percentage_Code': encode_rank(public_transportation_rank, skewed_rank_codes),
+        'Walking_Biking_Work_Percentage_Code': encode_rank(walking_biking_rank, skewed_rank_codes),
+        'Area_Classification_Code': encode_rank(city_metrics['Area_Classification'], area_classification_codes)
+    })
+
     zipcode_metrics_results.update({city:city_metrics})
 
 
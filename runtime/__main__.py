@@ -0,0 +1,95 @@
+import argparse, json, sys
+from runtime.dataset import IdealHomeDataset
+from runtime.profile_scoring import affordable_home_price, resolve_location, score_profile, unflatten_profile
+"""
+    Command Line Scoring - No GUI Modules are Imported
+
+    Usage (From the Project Folder):
+        python -m runtime score --profile profile.json --top 5
+        python -m runtime score --profile profile.json --seasons "4 Seasons" --family-location-state TX --family-location-city Austin
+        python -m runtime score --profile profile.json --hard-constraints '{"Affordable": true, "Min_Temperature": [30, null]}'
+        python -m runtime resolve --state TX --city Austin
+        python -m runtime affordability --income 85000 --percent-income-allocated 30% --interest-rate 6.5 --mortgage-term "30 Years"
+
+    Profile Keys Match the Keyword Arguments of the IdealHomeDataAnalysis Frame Functions (See Profile Scoring)
+    Flags Override the Profile File. Use --profile - to Read the Profile from Stdin
+    Output is JSON on Stdout. Errors are Printed as {'Errors': [...]} w/ Exit Status 1
+"""
+
+profile_flags = ['radius_index', 'married', 'married_importance', 'children', 'children_importance', 'school_enrollment_importance',
+    'employed_status', 'regional_employment_importance', 'work_transportation', 'commute_time',
+    'income', 'affordable_home_price', 'percent_income_allocated', 'interest_rate', 'mortgage_term', 'adjustments',
+    'education_level', 'education_level_importance', 'living_enviornment', 'living_enviornment2',
+    'seasons', 'summer_temperature', 'winter_temperature', 'precipitation_level', 'sunshine_level',
+    'natural_disaster_risk', 'disaster_to_avoid', 'disaster_to_avoid2', 'disaster_to_avoid3',
+    'family_location_state', 'family_location_city', 'family_location_zipcode',
+    'family_location2_state', 'family_location2_city', 'family_location2_zipcode',
+    'work_location_state', 'work_location_city', 'work_location_zipcode']
+
+
+def read_profile(args):
+    profile = {}
+    if args.profile:
+        with (sys.stdin if args.profile == '-' else open(args.profile)) as f:
+            profile = json.load(f)
+
+    # Flattened Location Flags Fold into Location Dictionaries (See Profile Scoring unflatten_profile)
+    flag_profile = unflatten_profile({flag: getattr(args, flag) for flag in profile_flags if getattr(args, flag) is not None})
+    for key, value in flag_profile.items():
+        profile[key] = {**profile.get(key, {}), **value} if isinstance(value, dict) else value
+    # Hard Constraints as JSON (See Constraint Index)
+    if args.hard_constraints:
+        profile['hard_constraints'] = json.loads(args.hard_constraints)
+
+    return profile
+
+def score_command(args):
+    result, errors = score_profile(IdealHomeDataset(), read_profile(args), top_n=args.top)
+    return {'Errors': errors} if errors else result
+
+def resolve_command(args):
+    result, coordinates = resolve_location(IdealHomeDataset(), state=args.state, city=args.city, zipcode=args.zipcode)
+    return {'Result': result, 'Coordinates': coordinates} if coordinates else {'Errors': [result]}
+
+def affordability_command(args):
+    # No Dataset Needed
+    return {'Affordable_Home_Price': affordable_home_price(args.income, args.percent_income_allocated, args.interest_rate, args.mortgage_term, args.adjustments)}
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog='python -m runtime', description='Score profiles and resolve locations without the GUI.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    score_parser = subparsers.add_parser('score', help='Score a profile and print the top result')
+    score_parser.add_argument('--profile', default=None, help='Profile JSON file, or - for stdin')
+    score_parser.add_argument('--top', type=int, default=0, help='Also print the top N cities')
+    score_parser.add_argument('--hard-constraints', default=None, help='JSON object of hard constraints, e.g. {"Area_Classification": ["Urban"]}')
+    for flag in profile_flags:
+        score_parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, default=None)
+    score_parser.set_defaults(command_function=score_command)
+
+    resolve_parser = subparsers.add_parser('resolve', help='Resolve a state, city, or zipcode to a location')
+    resolve_parser.add_argument('--state', default='')
+    resolve_parser.add_argument('--city', default='')
+    resolve_parser.add_argument('--zipcode', default='')
+    resolve_parser.set_defaults(command_function=resolve_command)
+
+    affordability_parser = subparsers.add_parser('affordability', help='Calculate the affordable home price')
+    affordability_parser.add_argument('--income', type=float, required=True)
+    affordability_parser.add_argument('--percent-income-allocated', required=True, help='15%%, 20%%, 25%%, 30%%, 35%%, or 40%%')
+    affordability_parser.add_argument('--interest-rate', type=float, required=True)
+    affordability_parser.add_argument('--mortgage-term', required=True, help='15 Years or 30 Years')
+    affordability_parser.add_argument('--adjustments', default='No Change', help='-10%%, -5%%, No Change, +5%%, or +10%%')
+    affordability_parser.set_defaults(command_function=affordability_command)
+
+    args = parser.parse_args(argv)
+    try:
+        output = args.command_function(args)
+    # Missing Fields & Wrong Field Types, e.g. a Number Where a Selection String is Expected
+    except (KeyError, ValueError, TypeError, AttributeError, IndexError) as e:
+        output = {'Errors': [f'Invalid Profile: {e!r}']}
+
+    print(json.dumps(output, indent=2))
+    return 1 if 'Errors' in output else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
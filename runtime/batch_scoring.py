@@ -0,0 +1,117 @@
+import argparse, csv, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from runtime.dataset import IdealHomeDataset
+from runtime.profile_scoring import score_profile, unflatten_profile
+
+"""
+    Headless Batch Scoring of Client Profile Files
+
+    Usage:
+        python -m runtime.batch_scoring profiles.jsonl results.jsonl --workers 8
+
+    Input: JSON Lines or CSV of Complete Profiles (See Profile Scoring score_profile)
+        CSV Location Columns are Flattened: family_location_state, family_location_city, family_location_zipcode, ...
+    Output: JSON Lines or CSV (by File Extension) Written as Each Chunk Finishes
+
+    Each Worker Process Loads the Dataset Once. Profiles are Read Lazily and the Number of
+    Chunks in Flight is Bounded, so Memory Stays Flat for Any Input Size.
+"""
+
+result_fields = ['Profile_ID', 'Result_City', 'Match_Percentage', 'Region_Name', 'Afforability_Warning', 'Errors']
+
+# Dataset Loaded Once per Worker Process
+worker_dataset = None
+
+
+def load_worker_data():
+    global worker_dataset
+    worker_dataset = IdealHomeDataset().load()
+
+def profile_from_csv_row(row: dict):
+    # Empty Cells are Omitted
+    return unflatten_profile({column: value for column, value in row.items() if value != '' and value is not None})
+
+def read_profiles(input_path: str):
+    # Yield (Profile ID, Profile) Pairs Without Loading the Whole File
+    with open(input_path, newline='') as f:
+        if input_path.endswith('.csv'):
+            for line_number, row in enumerate(csv.DictReader(f), start=1):
+                profile = profile_from_csv_row(row)
+                yield profile.get('id', line_number), profile
+        else:
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    profile = json.loads(line)
+                    yield profile.get('id', line_number), profile
+
+def score_profile_chunk(profile_chunk: list):
+    results = []
+    for profile_id, profile in profile_chunk:
+        try:
+            result, errors = score_profile(worker_dataset, profile)
+        # Wrong Field Types Surface as TypeError or AttributeError. A Bad Profile Never Stops the Batch
+        except (KeyError, ValueError, TypeError, AttributeError, IndexError) as e:
+            result, errors = None, [f'Invalid Profile: {e!r}']
+        result = result or {}
+
+        results.append({
+            'Profile_ID': profile_id,
+            'Result_City': result.get('Result_City'),
+            'Match_Percentage': result.get('Match_Percentage'),
+            'Region_Name': result.get('Region_Name'),
+            'Afforability_Warning': result.get('Afforability_Warning'),
+            'Errors': errors
+        })
+    return results
+
+def run_batch_scoring(input_path: str, output_path: str, workers: int = None, chunk_size: int = 64, max_chunks_in_flight: int = None):
+    workers = workers or os.cpu_count()
+    max_chunks_in_flight = max_chunks_in_flight or workers * 4
+    profiles = read_profiles(input_path)
+    total_profiles = 0
+
+    with open(output_path, 'w', newline='') as output_file, ProcessPoolExecutor(max_workers=workers, initializer=load_worker_data) as executor:
+        csv_writer = None
+        if output_path.endswith('.csv'):
+            csv_writer = csv.DictWriter(output_file, fieldnames=result_fields)
+            csv_writer.writeheader()
+
+        in_flight = set()
+        while True:
+            # Keep the Pool Busy w/o Reading Ahead of the Workers
+            while len(in_flight) < max_chunks_in_flight:
+                profile_chunk = list(islice(profiles, chunk_size))
+                if not profile_chunk:
+                    break
+                in_flight.add(executor.submit(score_profile_chunk, profile_chunk))
+            if not in_flight:
+                break
+
+            # Stream Results as Chunks Finish
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                for result in future.result():
+                    if csv_writer:
+                        csv_writer.writerow({**result, 'Errors': '; '.join(result['Errors'])})
+                    else:
+                        output_file.write(json.dumps(result) + '\n')
+                    total_profiles += 1
+
+    return total_profiles
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Score a JSONL or CSV file of profiles across a process pool.')
+    parser.add_argument('input_path', help='Profiles file (.jsonl or .csv)')
+    parser.add_argument('output_path', help='Results file (.jsonl or .csv)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='Profiles sent to a worker at once')
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    total_profiles = run_batch_scoring(args.input_path, args.output_path, workers=args.workers, chunk_size=args.chunk_size)
+    elapsed_time = time.perf_counter() - start_time
+    print(f'Scored {total_profiles} profiles in {elapsed_time:.1f}s ({total_profiles / max(elapsed_time, 1e-9):.1f} profiles/s)', file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
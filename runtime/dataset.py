@@ -0,0 +1,120 @@
+import threading
+from functools import cached_property
+from runtime.utilities.calculation_utilities import precompute_coordinate_table
+from runtime.utilities.data_bundle import RuntimeData, default_data_bundle_path, boundary_columns
+from runtime.utilities.spatial_index import ZipcodeGridIndex
+from runtime.utilities.location_index import LocationIndex
+from runtime.utilities.zipcode_records import ZipcodeRecordStore
+from runtime.utilities.constraint_index import ConstraintIndex
+from runtime.utilities.state_abbreviations import states_abbreviation_list
+from runtime.utilities.instrumentation import Instrumentation
+
+class IdealHomeDataset():
+
+    """
+        Read-Only Reference Data Shared by Every Profile (See Profile Scoring)
+        Holds No User Selections, so One Instance is Shared Across Threads, Sessions, & Requests
+
+        Each Dataset is Loaded on First Access. Call load() Before Sharing to Build Everything Once Up Front
+    """
+
+    def __init__(self, data_bundle_path: str = default_data_bundle_path, instrumentation: Instrumentation = None):
+
+        # Runtime Data from the Data Bundle, or the Ranked Data Files if the Bundle is Unavailable (See Data Bundle)
+        self.runtime_data = RuntimeData(data_bundle_path)
+        # Opt-in Timing Spans & Counters (See Instrumentation)
+        self.instrumentation = instrumentation or Instrumentation()
+
+        self.state_list = [*states_abbreviation_list.keys()]
+        self.load_lock = threading.Lock()
+
+    # -------------- Lazy Loaded Data -------------------
+    @cached_property
+    def city_name_list(self):
+        # List of all City Names - Not State Specific. Sets the Row Order for Columnar Data
+        return self.runtime_data.dataset('Zipcode_Coordinates')['City_Names']
+
+    @cached_property
+    def zipcode_coordinates(self):
+        return self.runtime_data.dataset('Zipcode_Coordinates')['Zipcode_Coordinates']
+
+    @cached_property
+    def location_index(self):
+        # Location Index for City, State, & Zipcode Lookups
+        zipcode_coordinate_data = self.runtime_data.dataset('Zipcode_Coordinates')
+        coordinate_states = zipcode_coordinate_data['Coordinate_States']
+        return LocationIndex(self.zipcode_records, [coordinate_states[state_index] for state_index in zipcode_coordinate_data['City_State_Index'].tolist()])
+
+    @cached_property
+    def zipcode_coordinate_table(self):
+        # Precomputed Coordinate Table of the Zipcode Coordinates for Distance Calculations
+        return precompute_coordinate_table(self.zipcode_coordinates)
+
+    @cached_property
+    def zipcode_spatial_index(self):
+        return ZipcodeGridIndex(self.zipcode_coordinate_table)
+
+    @cached_property
+    def zipcode_columns(self):
+        # Columnar Zipcode Data for Vectorized Scoring - Includes the Zipcode Prefix & State Index of Each Row
+        zipcode_data = self.runtime_data.dataset('Zipcode')
+        return {column: zipcode_data[column] for column in zipcode_data['Zipcode_Column_Names']}
+
+    @cached_property
+    def zipcode_records(self):
+        # Zipcode -> Row Lookups & Row Views over the Zipcode Columns (See Zipcode Records)
+        return ZipcodeRecordStore(self.zipcode_columns, self.city_name_list, self.zipcode_coordinates)
+
+    @cached_property
+    def constraint_index(self):
+        # Sorted Arrays & Row Lists for Hard Constraint Filters (See Constraint Index)
+        return ConstraintIndex(self.zipcode_columns, self.zipcode_prefix_weather_matrix)
+
+    @cached_property
+    def zipcode_prefix_list(self):
+        return self.runtime_data.dataset('Zipcode')['Zipcode_Prefixes']
+
+    @cached_property
+    def zipcode_prefix_weather_matrix(self):
+        # Weather Ranked Data as a Zipcode Prefix x Feature Matrix - Aligned w/ the Zipcode Prefix List
+        return self.runtime_data.dataset('Weather')['Weather_Matrix']
+
+    @cached_property
+    def state_natural_disaster_codes(self):
+        # Natural Disaster Rank Codes as a State x Disaster Type x (Severity, Frequency) Array - Aligned w/ the State List
+        return self.runtime_data.dataset('Natural_Disaster')['Natural_Disaster_Codes']
+
+    @cached_property
+    def natural_disaster_type_columns(self):
+        return {disaster_type: column for column, disaster_type in enumerate(self.runtime_data.dataset('Natural_Disaster')['Disaster_Types'])}
+
+    @cached_property
+    def zipcode_prefix_region_names(self):
+        # Zipcode Prefix Region Names as Hash Map
+        region_name_data = self.runtime_data.dataset('Region_Name')
+        return dict(zip(region_name_data['Region_Prefixes'], region_name_data['Region_Names']))
+
+    @cached_property
+    def zipcode_prefix_boundary_data(self):
+        # Zipcode Prefix Boundaries as Hash Map
+        boundary_data = self.runtime_data.dataset('Zipcode_Prefix_Boundary')
+        return {zipcode_prefix: dict(zip(boundary_columns, boundary)) for zipcode_prefix, boundary in zip(boundary_data['Boundary_Prefixes'], boundary_data['Zipcode_Prefix_Boundaries'].tolist())}
+
+    def load(self):
+        """
+            Load Every Dataset & Build the Indexes. Returns the Dataset
+            Serialized, so Concurrent Callers Never Build the Same Index Twice
+        """
+        with self.load_lock:
+            for name in ['location_index', 'zipcode_spatial_index', 'zipcode_columns', 'zipcode_records', 'constraint_index', 'zipcode_prefix_list', 'zipcode_prefix_weather_matrix', 'state_natural_disaster_codes', 'natural_disaster_type_columns', 'zipcode_prefix_region_names', 'zipcode_prefix_boundary_data']:
+                getattr(self, name)
+        return self
+
+    def prefetch_data(self):
+        """
+            Load the Datasets & Build the Indexes in a Background Thread
+            Returns the Thread. Accessing the Data Before the Thread Finishes Loads it on Demand
+        """
+        prefetch_thread = threading.Thread(target=self.load, name='Prefetch_Data', daemon=True)
+        prefetch_thread.start()
+        return prefetch_thread
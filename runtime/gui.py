@@ -1,10 +1,9 @@
 from tkinter import messagebox, StringVar
 import customtkinter
-from tkintermapview import TkinterMapView
-import os, sys, pathlib, webbrowser
-from PIL import Image
-from runtime.data_analysis import IdealHomeDataAnalysis
+import os, sys, io, pathlib, webbrowser, threading, queue, time
+from PIL import Image, ImageTk, UnidentifiedImageError
 from runtime.utilities.instructions import instructions_text
+from runtime.utilities.tile_cache import TileCache, fitting_zoom
 from version import current_version
 current_path = str(pathlib.Path(__file__).parent.parent)
 
@@ -18,7 +17,6 @@ customtkinter.set_default_color_theme("blue")
 class App(customtkinter.CTk):
     def __init__(self):
         super().__init__()
-        self.after(1, self.load_data_analysis)
 
         # Window Title
         self.title(" Ideal Home Location Matcher")
@@ -68,6 +66,15 @@ class App(customtkinter.CTk):
         self.map_marker_region = None
         self.results_polygon = None
         self.radius_index = 0
+        # Results are Computed in a Worker Thread. Each Request has an ID so Stale Results are Discarded
+        self.results_queue = queue.Queue()
+        self.results_lock = threading.Lock()
+        self.results_request_id = 0
+        self.results_pending = False
+        self.results_polling = False
+
+        # Persistent Map Tile Cache Shared Across Sessions
+        self.tile_cache = TileCache()
 
         """ 
             Header Frame 
@@ -87,6 +94,9 @@ class App(customtkinter.CTk):
         # Version label
         version_label = customtkinter.CTkLabel(self.header_frame, text=f'Version: {current_version}', font=customtkinter.CTkFont(family='Telex', size=12, weight="normal"))
         version_label.grid(row=0, column=1, padx=19, pady=10, sticky='se')
+        # Status Label
+        self.status_label = customtkinter.CTkLabel(self.header_frame, text='Loading Data...', font=customtkinter.CTkFont(family='Telex', size=12, weight="normal"))
+        self.status_label.grid(row=0, column=1, padx=19, pady=10, sticky='ne')
 
         """ 
             Sidebar Frame 
@@ -137,9 +147,19 @@ class App(customtkinter.CTk):
         instructions_textbox.grid(row=1, column=0, columnspan=3, padx=20, pady=15, sticky="nsew")
         instructions_textbox.insert("0.0", instructions_text)
         instructions_textbox.configure(state="disabled")
-        # Navigation Button
-        instruction_get_started_button = customtkinter.CTkButton(master=self.intro_frame, width=120, height=30, border_width=1, text='Get Started', text_color="#DCE4EE", font=self.regular_font, command=self.instruction_button_event)
-        instruction_get_started_button.grid(row=3, column=2, padx=20, pady=20, sticky="s")
+        # Navigation Button - Enabled Once the Data is Loaded
+        self.instruction_get_started_button = customtkinter.CTkButton(master=self.intro_frame, width=120, height=30, border_width=1, text='Loading...', text_color="#DCE4EE", font=self.regular_font, command=self.instruction_button_event, state='disabled')
+        self.instruction_get_started_button.grid(row=3, column=2, padx=20, pady=20, sticky="s")
+        # Loading Indicator
+        self.loading_progressbar = customtkinter.CTkProgressBar(self.intro_frame, width=200, mode='indeterminate')
+        self.loading_progressbar.grid(row=3, column=1, padx=20, pady=32, sticky="s")
+        self.loading_progressbar.start()
+
+        # Load the Data in a Worker Thread & Poll for the Handoff so the Window Stays Responsive
+        self.IdealHomeDataAnalysis = None
+        self.data_analysis_queue = queue.Queue()
+        threading.Thread(target=self.load_data_analysis, name='Load_Data_Analysis', daemon=True).start()
+        self.after(50, self.check_data_analysis_loaded)
 
 
     def build_family_location_frame_1(self):
@@ -707,6 +727,9 @@ class App(customtkinter.CTk):
         self.results_label_2 = customtkinter.CTkLabel(self.results_frame, text="It's recommended to look for a home in the greater Area.", font=self.large_font, fg_color=self.label_color)
         self.results_label_2.grid(row=2, column=0, columnspan=3, padx=40, pady=(20, 15), sticky='')
 
+        # Computing Results Indicator
+        self.results_progressbar = customtkinter.CTkProgressBar(self.results_frame, width=300, mode='indeterminate')
+
         # Navigation Buttons
         results_previous_button = customtkinter.CTkButton(master=self.results_frame, text='Previous', width=120, height=30, border_width=1, text_color="#DCE4EE", font=self.regular_font, command=self.frame_7_backward_event)
         results_previous_button.grid(row=11, column=0, padx=20, pady=20, sticky="sw")
@@ -1211,23 +1234,24 @@ class App(customtkinter.CTk):
         self.natural_disaster_frame.grid_forget()
         if not self.results_frame:
             self.build_results_frame_7()
-        self.IdealHomeDataAnalysis.natural_disaster_risk_frame_6(natural_disaster_risk=self.natural_disaster_seg_button_1.get(),
+        natural_disaster_selections = dict(natural_disaster_risk=self.natural_disaster_seg_button_1.get(),
             disaster_to_avoid=self.natural_disaster_seg_button_2.get(),
             disaster_to_avoid2=self.natural_disaster_seg_button_3.get(),
             disaster_to_avoid3=self.natural_disaster_seg_button_4.get()
         )
-        self.final_results = self.IdealHomeDataAnalysis.results_frame_7()
-        self.city_name = self.final_results['Result_City']
-        self.city_coordinates = self.final_results['Result_City_Coordinates']
-        self.zipcode_prefix_boundary = self.final_results['Zipcode_Prefix_Boundary']
-        self.results_label_1.configure(text=f"You have a {self.final_results['Match_Percentage']}% Match with {self.city_name}")
-        self.results_label_2.configure(text=f"It's recommended to look for a home in the greater {self.final_results['Region_Name']} Area.")
-        self.set_map_position()
-        self.after(100, self.set_map_results)
+        # Session State is Only Changed on the Tk Thread. The Worker Scores a Snapshot
+        self.IdealHomeDataAnalysis.natural_disaster_risk_frame_6(**natural_disaster_selections)
+        selections, search_rows, cached_component_scores = self.IdealHomeDataAnalysis.search_snapshot()
+        # A New Request Replaces Any Computation Still Running
+        self.results_request_id += 1
+        self.results_pending = True
+        self.show_results_computing()
+        threading.Thread(target=self.compute_results, args=(self.results_request_id, self.IdealHomeDataAnalysis.dataset, selections, search_rows, cached_component_scores), name='Compute_Results', daemon=True).start()
+        if not self.results_polling:
+            self.results_polling = True
+            self.after(50, self.check_results_computed)
         self.results_frame.grid(row=1, column=0, rowspan=3, columnspan=3, sticky="nsew")
         self.progressbar.set(1)
-        if  self.final_results['Afforability_Warning']:
-            self.error_message('Afforability_Warning')
 
     def frame_6_backward_event(self):
         self.natural_disaster_frame.grid_forget()
@@ -1236,11 +1260,13 @@ class App(customtkinter.CTk):
 
     # FRAME 7
     def frame_7_backward_event(self):
+        self.cancel_results()
         self.results_frame.grid_forget()
         self.natural_disaster_frame.grid(row=1, column=0, rowspan=3, columnspan=3, sticky="nsew")
         self.progressbar.set(.875)
 
     def frame_7_restart_event(self):
+        self.cancel_results()
         self.results_frame.grid_forget()
         self.intro_frame.grid(row=1, column=0, rowspan=3, columnspan=3, sticky="nsew")
         self.progressbar.set(0)
@@ -1286,14 +1312,148 @@ class App(customtkinter.CTk):
         self.work_seg_button_4.set(display_options_list[self.radius_index])
 
     def load_data_analysis(self):
-        self.IdealHomeDataAnalysis = IdealHomeDataAnalysis()
+        # Worker Thread - No Tk Calls. Results are Handed Off Through the Queue
+        start_time = time.perf_counter()
+        try:
+            # Deferred Import, NumPy & the Data Analysis Load Off the Main Thread
+            from runtime.data_analysis import IdealHomeDataAnalysis
+            data_analysis = IdealHomeDataAnalysis()
+            # Data Needed by the Location Frames
+            data_analysis.dataset.location_index
+            data_analysis.dataset.zipcode_spatial_index
+        except Exception as e:
+            self.data_analysis_queue.put(('Error', e))
+            return
+        self.data_analysis_queue.put(('Loaded', data_analysis, time.perf_counter() - start_time))
+
+        # Remaining Datasets Load in the Background While the Instructions are Shown
+        data_analysis.prefetch_data()
+
+    def check_data_analysis_loaded(self):
+        try:
+            status, *result = self.data_analysis_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self.check_data_analysis_loaded)
+            return
+
+        self.loading_progressbar.stop()
+        self.loading_progressbar.grid_forget()
+        if status == 'Loaded':
+            self.IdealHomeDataAnalysis, load_time = result
+            self.status_label.configure(text=f'Data Loaded in {load_time:.2f}s')
+            self.instruction_get_started_button.configure(state='normal', text='Get Started')
+        else:
+            self.status_label.configure(text='Data Failed to Load')
+            messagebox.showerror('Data Load Error', f'Unable to load the location data: {result[0]}')
+
+    def compute_results(self, request_id: int, dataset, selections: dict, search_rows, cached_component_scores: dict):
+        """
+            Worker Thread - No Tk Calls & No Session State. Scores the Snapshot w/ the Pure Functions on the Read-Only Dataset
+            Cached Component Scores are Only Read. Newly Calculated Ones are Returned for the Session to Store on the Tk Thread
+        """
+        from runtime.profile_scoring import score_search, snapshot_component_score, top_city_result
+        # One Computation at a Time, so Stale Requests Don't Compete for the CPU
+        with self.results_lock:
+            # Cancelled While Waiting
+            if request_id != self.results_request_id:
+                return
+            calculated_component_scores = {}
+            try:
+                final_results = top_city_result(dataset, score_search(dataset, selections, search_rows, snapshot_component_score(cached_component_scores, calculated_component_scores)))
+            except Exception as e:
+                self.results_queue.put((request_id, 'Error', e))
+                return
+        self.results_queue.put((request_id, 'Computed', (final_results, calculated_component_scores)))
+
+    def check_results_computed(self):
+        # Deliver the Result of the Current Request. Results of Cancelled Requests are Discarded
+        while not self.results_queue.empty():
+            request_id, status, result = self.results_queue.get_nowait()
+            if status == 'Computed':
+                # Component Scores of Cancelled Requests are Still Valid for their Selections
+                result, calculated_component_scores = result
+                self.IdealHomeDataAnalysis.store_component_scores(calculated_component_scores)
+            if request_id == self.results_request_id and self.results_pending:
+                self.results_pending = False
+                self.hide_results_computing()
+                if status == 'Computed':
+                    self.show_results(result)
+                else:
+                    messagebox.showerror('Search Results Error', f'Unable to compute results: {result}')
+
+        if self.results_pending:
+            self.after(50, self.check_results_computed)
+        else:
+            self.results_polling = False
+
+    def cancel_results(self):
+        # Any Result Still Computing is Discarded When it Arrives
+        self.results_request_id += 1
+        self.results_pending = False
+        self.hide_results_computing()
+
+    def show_results_computing(self):
+        self.results_label_1.configure(text="Finding Your Ideal Home...")
+        self.results_label_2.configure(text="Scoring every city in the search area.")
+        if hasattr(self, 'map_widget'):
+            self.map_widget.grid_forget()
+        self.results_progressbar.grid(row=10, column=0, columnspan=3, padx=40, pady=20, sticky='n')
+        self.results_progressbar.start()
+
+    def hide_results_computing(self):
+        if self.results_frame:
+            self.results_progressbar.stop()
+            self.results_progressbar.grid_forget()
+
+    def show_results(self, final_results: dict):
+        self.final_results = final_results
+        self.city_name = self.final_results['Result_City']
+        self.city_coordinates = self.final_results['Result_City_Coordinates']
+        self.zipcode_prefix_boundary = self.final_results['Zipcode_Prefix_Boundary']
+        self.results_label_1.configure(text=f"You have a {self.final_results['Match_Percentage']}% Match with {self.city_name}")
+        self.results_label_2.configure(text=f"It's recommended to look for a home in the greater {self.final_results['Region_Name']} Area.")
+        self.set_map_position()
+        self.after(100, self.set_map_results)
+        if  self.final_results['Afforability_Warning']:
+            self.error_message('Afforability_Warning')
 
     def set_map_position(self):
-        self.map_widget = TkinterMapView(self.results_frame, corner_radius=0)
+        # Deferred Import, the Map is First Needed on the Results Frame
+        from tkintermapview import TkinterMapView
+        # Map Loads Every Tile Through the Persistent Tile Cache (See request_map_tile)
+        self.map_widget = TkinterMapView(self.results_frame, corner_radius=0, database_path=self.tile_cache.database_path)
+        self.map_widget.request_image = self.request_map_tile
         self.map_widget.grid(row=10, column=0, columnspan=3, sticky="nswe", padx=6, pady=(10,5))
-        self.map_widget.set_tile_server("https://a.tile.openstreetmap.org/{z}/{x}/{y}.png", max_zoom=22)
+        self.map_widget.set_tile_server(self.tile_cache.tile_server, max_zoom=22)
         self.map_position = self.map_widget.set_position(self.city_coordinates[0], self.city_coordinates[1]) 
-        self.map_widget.fit_bounding_box((self.zipcode_prefix_boundary['North_Boundary']+0.1, self.zipcode_prefix_boundary['West_Boundary']-0.1), (self.zipcode_prefix_boundary['South_Boundary']-0.1, self.zipcode_prefix_boundary['East_Boundary']+0.1))
+        top_left = (self.zipcode_prefix_boundary['North_Boundary']+0.1, self.zipcode_prefix_boundary['West_Boundary']-0.1)
+        bottom_right = (self.zipcode_prefix_boundary['South_Boundary']-0.1, self.zipcode_prefix_boundary['East_Boundary']+0.1)
+        self.prefetch_map_tiles(top_left, bottom_right)
+        self.map_widget.fit_bounding_box(top_left, bottom_right)
+
+    def request_map_tile(self, zoom: int, x: int, y: int, db_cursor=None):
+        """
+            Replaces TkinterMapView.request_image, Which Only Reads the Tile Database & Never Stores Downloaded Tiles
+            Tiles Come from the Tile Cache, Which Stores Each Downloaded Tile (or Reads the Local Tile Directory)
+            Called on the Map Widget Threads w/ Their Own Database Cursor
+        """
+        tile_image = self.tile_cache.tile_image(zoom, x, y, db_cursor.connection if db_cursor is not None else None)
+        if tile_image is None or not self.map_widget.running:
+            return self.map_widget.empty_tile_image
+
+        try:
+            image_tk = ImageTk.PhotoImage(Image.open(io.BytesIO(tile_image)))
+        except UnidentifiedImageError:
+            # Tile Does Not Exist for the Coordinates
+            image_tk = self.map_widget.empty_tile_image
+        self.map_widget.tile_image_cache[f"{zoom}{x}{y}"] = image_tk
+        return image_tk
+
+    def prefetch_map_tiles(self, top_left: tuple, bottom_right: tuple):
+        # Cache the Result Region at the Fitted Zoom & One Level Out/In in the Background
+        self.map_widget.update_idletasks()
+        zoom = fitting_zoom(top_left, bottom_right, self.map_widget.winfo_width(), self.map_widget.winfo_height(), max_zoom=22)
+        self.tile_cache.prefetch_bounding_box(top_left, bottom_right, [zoom, zoom - 1, zoom + 1])
 
     def set_map_results(self, **kwargs):
         if self.map_marker:
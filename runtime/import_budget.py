@@ -0,0 +1,73 @@
+import argparse, json, subprocess, sys
+"""
+    Import Time Budget Report for the GUI Startup
+
+    Usage (From the Project Folder):
+        python -m runtime.import_budget --budget-ms 250
+
+    Imports the Module in a Fresh Interpreter with -X importtime (Best of --repeat Runs) and
+    Reports the Self Time by Top Level Package. Fails if the Total is Over the Budget or if a
+    Deferred Module is Imported at Startup.
+"""
+
+# Imported on First Use, Never at GUI Startup
+deferred_modules = ['numpy', 'thefuzz', 'tkintermapview', 'urllib.request', 'runtime.data_analysis']
+
+
+def measure_imports(module: str):
+    # Module -> (Self Microseconds, Cumulative Microseconds) from -X importtime
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative_time, imported_module = line[len('import time:'):].split('|')
+        import_times[imported_module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+def import_budget_report(module: str = 'runtime.gui', repeat: int = 5):
+    # Best of Repeated Runs per Module Filters Out Disk Cache & Scheduling Noise
+    import_times = {}
+    for _ in range(repeat):
+        for imported_module, times in measure_imports(module).items():
+            import_times[imported_module] = min(import_times.get(imported_module, times), times)
+
+    package_times = {}
+    for imported_module, (self_time, _) in import_times.items():
+        package = imported_module.split('.')[0]
+        package_times[package] = package_times.get(package, 0) + self_time
+
+    return {
+        'Module': module,
+        'Total_ms': import_times[module][1] / 1000,
+        'Package_ms': {package: self_time / 1000 for package, self_time in sorted(package_times.items(), key=lambda item: -item[1])},
+        'Deferred_Imported': [deferred_module for deferred_module in deferred_modules if deferred_module in import_times] if module == 'runtime.gui' else []
+    }
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Report the import time of the GUI startup against a budget.')
+    parser.add_argument('--module', default='runtime.gui', help='Module to import (default: runtime.gui)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs, the fastest time per module is kept')
+    parser.add_argument('--budget-ms', type=float, default=None, help='Fail if the total import time is over the budget')
+    parser.add_argument('--top', type=int, default=15, help='Packages shown in the report')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = import_budget_report(args.module, args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'Package':<32}{'Self ms':>10}")
+        for package, self_time in list(report['Package_ms'].items())[:args.top]:
+            print(f'{package:<32}{self_time:>10.1f}')
+        print(f"{'Total ' + args.module:<32}{report['Total_ms']:>10.1f}")
+
+    failures = [f'{deferred_module} is imported at startup' for deferred_module in report['Deferred_Imported']]
+    if args.budget_ms is not None and report['Total_ms'] > args.budget_ms:
+        failures.append(f"Import time {report['Total_ms']:.1f} ms is over the {args.budget_ms:.1f} ms budget")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
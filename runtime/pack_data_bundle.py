@@ -0,0 +1,26 @@
+import argparse, os, sys, time
+from runtime.utilities.data_bundle import RuntimeData, write_data_bundle, default_data_bundle_path
+
+"""
+    Compile the Ranked Data Files into the Runtime Data Bundle
+
+    Usage (From the Project Folder):
+        python -m runtime.pack_data_bundle
+
+    Rerun After the Ranked Data Changes. An Out of Date Bundle is Ignored at Startup.
+"""
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Compile the ranked data files into a single binary data bundle.')
+    parser.add_argument('--output', default=default_data_bundle_path, help=f'Bundle path (default: {default_data_bundle_path})')
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    # Pack from the Ranked Data Files, Never from an Existing Bundle
+    write_data_bundle(args.output, RuntimeData(bundle_path=None))
+    elapsed_time = time.perf_counter() - start_time
+    print(f'Wrote {args.output} ({os.path.getsize(args.output) / 1e6:.1f} MB) in {elapsed_time:.1f}s', file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,645 @@
+import numpy as np
+from functools import cache
+from runtime.dataset import IdealHomeDataset
+from runtime.utilities.calculation_utilities import check_coordinates_distance_to_center, find_search_center, radius_safety_factor
+from runtime.utilities.scoring_utilities import rank_score_table, deviation_band_score, affordability_warning_mask, commute_score, education_score, top_k_indexes, weather_level_codes, weather_score, natural_disaster_score
+from runtime.utilities.state_abbreviations import states_abbreviation_list
+from runtime.utilities.instrumentation import instrumented
+"""
+    ## Profile Scoring
+    - Pure Functions of (Dataset, Profile Selections). Nothing is Written to the Dataset
+    - Safe to Call from Any Number of Threads Sharing One IdealHomeDataset
+
+    Profile Keys Match the Keyword Arguments of the IdealHomeDataAnalysis Frame Functions. Optional Location Keys:
+    'family_location', 'family_location2', 'work_location' as {'state', 'city', 'zipcode'}
+    'hard_constraints' to Exclude Cities Before Scoring (See Constraint Index)
+    The Affordable Home Price is Calculated if Not Provided (See affordable_home_price)
+
+    Component Scores are Requested Through a component_score(component, selections, calculate_score) Callable,
+    so a Session can Cache the Score Vectors it Reuses (See IdealHomeDataAnalysis.component_score).
+"""
+
+location_keys = ['family_location', 'family_location2', 'work_location']
+search_radius_miles = [10, 20, 40, 60, 100, 200]
+
+
+def uncached_component_score(component: str, selections: tuple, calculate_score):
+    return calculate_score()
+
+def snapshot_component_score(cached_component_scores: dict, calculated_component_scores: dict):
+    """
+        component_score over a Snapshot of Cached Score Vectors, for Scoring on Another Thread (See IdealHomeDataAnalysis.search_snapshot)
+        Cached Vectors are Only Read. Missing Vectors are Calculated into calculated_component_scores for the Session to Store
+    """
+    def component_score(component: str, selections: tuple, calculate_score):
+        if (component, selections) in cached_component_scores:
+            return cached_component_scores[(component, selections)]
+        score = calculated_component_scores[(component, selections)] = calculate_score()
+        return score
+    return component_score
+
+# -------------- Locations -------------------
+def unflatten_profile(flat_profile: dict):
+    # Fold Flattened Location Keys (e.g. family_location_state) into Location Dictionaries
+    profile = {}
+    for key, value in flat_profile.items():
+        location_key = next((location_key for location_key in location_keys if key.startswith(f'{location_key}_') and key[len(location_key) + 1:] in ['state', 'city', 'zipcode']), None)
+        if location_key:
+            profile.setdefault(location_key, {})[key[len(location_key) + 1:]] = value
+        else:
+            profile[key] = value
+    return profile
+
+def resolve_location(dataset: IdealHomeDataset, state: str = '', city: str = '', zipcode: str = ''):
+    """
+        Returns (Result String, Coordinates) or (Error Message, None)
+        Coordinates are a New List Each Call, the Location Index Cache is Shared by Every Session
+    """
+    if dataset.instrumentation.enabled:
+        location_cache_hits = dataset.location_index.resolve_location.cache_info().hits
+    result, coordinates = dataset.location_index.resolve_location(state=state, city=city, zipcode=zipcode)
+    if dataset.instrumentation.enabled:
+        dataset.instrumentation.count('Location_Cache_Hits' if dataset.location_index.resolve_location.cache_info().hits > location_cache_hits else 'Location_Cache_Misses')
+
+    return result, (list(coordinates) if coordinates is not None else None)
+
+def resolve_profile_locations(dataset: IdealHomeDataset, profile: dict):
+    """
+        Returns (Coordinates of Each Location Key, Errors). Missing Locations are Empty Lists
+    """
+    coordinates_list, errors = [[], [], []], []
+    for index, location_key in enumerate(location_keys):
+        location = profile.get(location_key)
+        if location:
+            result, coordinates = resolve_location(dataset, state=location.get('state', ''), city=location.get('city', ''), zipcode=location.get('zipcode', ''))
+            if coordinates:
+                coordinates_list[index] = coordinates
+            else:
+                errors.append(f'{location_key}: {result}')
+
+    return coordinates_list, errors
+
+def distance_to_center(coordinates_list: list):
+    # List of Saved Coordinates
+    args_list = [coordinate for coordinate in coordinates_list if coordinate]
+
+    # Return for 2 or 3 Coordinates
+    if len(args_list) >= 2:
+        return check_coordinates_distance_to_center(*args_list)
+    # No Distance if 0 or 1 Coordinate
+    return 0
+
+@instrumented('Location_Radius_Rows')
+def location_radius_rows(dataset: IdealHomeDataset, coordinates_list: list, radius_index: int):
+    """
+        Returns (Rows of the Cities Within the Search Radius, Errors). Every City Without Locations
+    """
+    # List of Saved Coordinates
+    args_list = [coordinate for coordinate in coordinates_list if coordinate]
+
+    errors = []
+    if args_list:
+        # Miles of Radius w/ Safety Factor
+        radius = search_radius_miles[radius_index] * radius_safety_factor
+        # Search Only the Grid Cells Around the Center
+        city_radius_rows, candidates_checked = dataset.zipcode_spatial_index.radius_search(find_search_center(*args_list), radius)
+        dataset.instrumentation.count('Radius_Candidates_Checked', candidates_checked)
+        # Check for Errors
+        if len(city_radius_rows) < 1:
+            errors.append('Please alter distance or city selections. Zero cities in area selected.')
+    else:
+        city_radius_rows = np.arange(len(dataset.city_name_list))
+    dataset.instrumentation.count('Cities_In_Radius', len(city_radius_rows))
+
+    return city_radius_rows, errors
+
+# -------------- Affordability -------------------
+def affordable_home_price(income: float, percent_income_allocated: str, interest_rate: float, mortgage_term: str, adjustments: str):
+    """
+        Equations Used:
+        M = P [ i(1 + i)^n ] / [ (1 + i)^n – 1]
+
+        M = Total monthly payment
+        P = The total amount of your loan
+        I = Your interest rate, as a monthly percentage
+        N = The total amount of months in your timeline for paying off your mortgage
+
+        Re-written solving for P
+        P = M [ (1 + i)^n – 1] / [ i(1 + i)^n ]
+    """
+
+    percent_income_allocated = int(percent_income_allocated[:2]) / 100
+    # Approximately 80% of Monthly Payment Goes to Mortgage & 20% Goes to Tax & Insurance
+    monthly_allowable_mortgage_payment = (income / 12) * percent_income_allocated * 0.8
+
+    # Units Conversion
+    monthly_interest_rate = interest_rate / (12 * 100)
+    total_months = int(mortgage_term[:2]) * 12
+
+    # Based on Equation Above
+    loan_amount = monthly_allowable_mortgage_payment * ((1 + monthly_interest_rate) ** total_months - 1) / (monthly_interest_rate * (1 + monthly_interest_rate) ** total_months)
+
+    # User Selected Adjustment Amount
+    adjustment_percent = int(adjustments[:3].replace('%','').replace('+','')) / 100 if adjustments != 'No Change' else 0
+
+    # Assuming the Standard 20% Down Payment
+    total_mortgage = round(int((loan_amount / 0.8) * (1 + adjustment_percent)), -3)
+
+    return total_mortgage
+
+def profile_home_price(profile: dict):
+    # Provided Affordable Home Price, Otherwise Calculated from the Income Selections
+    home_price = profile.get('affordable_home_price')
+    if not home_price:
+        home_price = affordable_home_price(income=float(profile['income']),
+            percent_income_allocated=profile['percent_income_allocated'],
+            interest_rate=float(profile['interest_rate']),
+            mortgage_term=profile['mortgage_term'],
+            adjustments=profile.get('adjustments', 'No Change'))
+    return float(home_price)
+
+# -------------- Weather & Natural Disasters -------------------
+def weather_selections(selections: dict):
+    # Hashable Weather Selections - Also the Weather Component Cache Key
+    return (selections['seasons'], float(selections['summer_temperature']), float(selections.get('winter_temperature') or 0), selections['precipitation_level'], selections['sunshine_level'])
+
+@instrumented('Zipcode_Prefix_Weather_Score')
+def zipcode_prefix_weather_score(dataset: IdealHomeDataset, weather_selections: tuple):
+    seasons, summer_temperature, winter_temperature, precipitation_level, sunshine_level = weather_selections
+
+    # Convert Values From User Friendly to Rank Codes
+    precipitation_code = weather_level_codes[precipitation_level]
+    sunshine_code = weather_level_codes[sunshine_level]
+
+    # Weather Score of Each Zipcode Prefix - Aligned w/ the Zipcode Prefix List
+    return weather_score(dataset.zipcode_prefix_weather_matrix, seasons, summer_temperature, winter_temperature, precipitation_code, sunshine_code)
+
+def max_possible_weather_score(weather_selections: tuple):
+    # Find Max Possible Score for Match Percentage
+    seasons = weather_selections[0]
+    max_temperature_score = 9 if seasons == '4 Seasons' else 6 if seasons == '2 Seasons' else 3
+    max_precipitation_score = max_sunshine_score = max_season_score = 4
+
+    return max_season_score + max_temperature_score + max_precipitation_score + max_sunshine_score
+
+def natural_disaster_selections(selections: dict):
+    # Hashable Natural Disaster Selections - Also the Natural Disaster Component Cache Key
+    # Convert Values From User Friendly to Search Friendly
+    disasters_to_avoid = [selections[key].replace('Thunderstorm','Lightning/Thunderstorms').replace('Hurricane', 'Tropical cyclone') for key in ['disaster_to_avoid', 'disaster_to_avoid2', 'disaster_to_avoid3']]
+    return (int(selections['natural_disaster_risk']), *disasters_to_avoid)
+
+@instrumented('State_Natural_Disaster_Score')
+def state_natural_disaster_score(dataset: IdealHomeDataset, natural_disaster_selections: tuple):
+    natural_disaster_risk, *disasters_to_avoid = natural_disaster_selections
+
+    # Combined Natural Disaster Data & Selected Disasters. Unknown Disaster Types use the No Record Column
+    no_record_column = dataset.state_natural_disaster_codes.shape[1] - 1
+    disaster_type_columns = [dataset.natural_disaster_type_columns['All'], *[dataset.natural_disaster_type_columns.get(disaster, no_record_column) for disaster in disasters_to_avoid]]
+
+    # Natural Disaster Score of Each State - Aligned w/ the State List
+    return natural_disaster_score(dataset.state_natural_disaster_codes, disaster_type_columns, natural_disaster_risk)
+
+def max_possible_natural_disaster_score(natural_disaster_selections: tuple):
+    # Find Max Possible Score for Match Percentage
+    natural_disaster_risk = natural_disaster_selections[0]
+    max_total_disaster_score = max_disaster_1_score = 2 * natural_disaster_risk
+    max_disaster_2_score = 1.41 * natural_disaster_risk
+    max_disaster_3_score = 0.83 * natural_disaster_risk
+
+    return max_total_disaster_score + max_disaster_1_score + max_disaster_2_score + max_disaster_3_score
+
+# -------------- City Scoring -------------------
+def column_rows(column: np.ndarray, city_rows: np.ndarray = None):
+    # Column Values of the Cities at the Rows, or Every City if No Rows are Given
+    return column if city_rows is None else column[city_rows]
+
+def work_score(dataset: IdealHomeDataset, regional_employment_importance: int, transportation_method: str, user_commute_time: int, city_rows: np.ndarray = None):
+    # Combined Regional Employment, Transportation Method, & Commute Score of the Cities at the Rows
+    zipcode_columns = dataset.zipcode_columns
+    city_quantity = len(dataset.city_name_list) if city_rows is None else len(city_rows)
+    employment_score_table, transportation_score_table = work_score_tables(regional_employment_importance, transportation_method)
+
+    # ---- Regional Employment Score ----
+    employment_score = employment_score_table[column_rows(zipcode_columns['Employment_Percentage'], city_rows)]
+
+    # ---- Transportation Method Score ----
+    transportation_column = work_transportation_column(transportation_method)
+    if transportation_column:
+        transportation_score = transportation_score_table[column_rows(zipcode_columns[transportation_column], city_rows)]
+    else:
+        transportation_score = np.zeros(city_quantity)
+
+    # ---- Commute Score ----
+    if transportation_method != 'Work From Home':
+        city_commute_score = commute_score(user_commute_time, column_rows(zipcode_columns['Travel_Time_To_Work'], city_rows))
+    else:
+        city_commute_score = np.zeros(city_quantity)
+
+    return employment_score + transportation_score + city_commute_score
+
+def work_transportation_column(transportation_method: str):
+    # Rank Column of the Transportation Method, None if the Method is Not Scored
+    if transportation_method == "Personal Vehicle":
+        return 'Motor_Vehicle_Work_Percentage'
+    elif transportation_method in ["Public Transportation", "Walking or Biking"]:
+        name = transportation_method.replace('or ', '').replace(' ', '_')
+        return f'{name}_Work_Percentage'
+    return None
+
+def work_score_tables(regional_employment_importance: int, transportation_method: str):
+    # (Regional Employment, Transportation Method) Score Tables
+    employment_scoring_order = [0, 0.25 * regional_employment_importance, 0.5 * regional_employment_importance, 0.75 * regional_employment_importance, 1 * regional_employment_importance]
+    transportation_scoring_order = [0, 1, 2, 3, 4] if transportation_method == "Personal Vehicle" else [0, 2, 3, 4]
+    return rank_score_table(employment_scoring_order, 0), rank_score_table(transportation_scoring_order, 0)
+
+def search_components(dataset: IdealHomeDataset, selections: dict, rows: np.ndarray):
+    """
+        Components of the City Score for the Selections. Returns ([(Component, Cache Key, Score Function, Upper Bound)], Max Possible Score)
+        Score Functions Score the Cities at the Given Rows, or Every City if None (See column_rows)
+        Upper Bounds Cheaply Bound the Score of the Cities at the Rows (See bounded_score_search). None if the Score Function
+        is a Cheap Lookup & its Own Bound
+        Selections Hold the Profile Keys w/ the Affordable Home Price Resolved
+    """
+    # ---- Married Score ----
+    married_importance = int(selections['married_importance'])
+    if selections['married'] == 'No':
+        married_scoring_order = [1 * married_importance, 0.75 * married_importance, 0.5 * married_importance, 0.25 * married_importance, 0]
+    else:
+        married_scoring_order = [0, 0.25 * married_importance, 0.5 * married_importance, 0.75 * married_importance, 1 * married_importance]
+
+    # ---- Children Score ----
+    children_importance = int(selections['children_importance'])
+    if selections['children'] == 'No':
+        children_scoring_order = [1 * children_importance, 0.75 * children_importance, 0.5 * children_importance, 0.25 * children_importance, 0]
+    else:
+        children_scoring_order = [0, 0.25 * children_importance, 0.5 * children_importance, 0.75 * children_importance, 1 * children_importance]
+
+    # ---- School Enrollment Score ----
+    school_enrollment_importance = str(selections['school_enrollment_importance'])
+    school_enrollment_scoring_order = [0, 0.25, 0.5, 0.75, 1] if school_enrollment_importance == '1' else [0, 0.5, 1, 1.5, 2] if school_enrollment_importance == '2' else [0, 0.75, 1.5, 2.25, 3] if school_enrollment_importance == '3' else [0, 1, 2, 3, 4] if school_enrollment_importance == '4' else [0, 1.25, 2.5, 3.75, 5]
+
+    # ---- Commute Score ----
+    user_commute_time = int(selections['commute_time'][6:8])
+
+    # ---- Education Level Score ----
+    education_level = selections['education_level']
+    education_importance = int(selections['education_level_importance'])
+    user_education_number = 0 if education_level == 'Less than High School' else 1 if education_level == 'High School' else 2 if education_level == "Associate's" else 3 if education_level == "Bachelor's" else 4 if education_level == "Master's" else 5
+
+    # ---- Living Enviornment Score ----
+    living_enviornment, living_enviornment2 = selections['living_enviornment'], selections['living_enviornment2']
+    living_enviornment_scoring_order1 = [4,2,1,0,0] if living_enviornment == 'Hyper Rural' else [2,4,2,1,0] if living_enviornment == 'Rural' else [1,2,4,2,1] if living_enviornment == 'Suburban' else [0,1,2,4,2] if living_enviornment == 'Urban' else [0,0,1,2,4]
+    living_enviornment_scoring_order2 = [2,1,0,0,0] if living_enviornment2 == 'Hyper Rural' else [1,2,1,0,0] if living_enviornment2 == 'Rural' else [0,1,2,1,0] if living_enviornment2 == 'Suburban' else [0,0,1,2,1] if living_enviornment2 == 'Urban' else [0,0,0,1,2]
+    area_classification_scoring_order = [order1 + order2 for order1, order2 in zip(living_enviornment_scoring_order1, living_enviornment_scoring_order2)]
+
+    zipcode_columns = dataset.zipcode_columns
+    user_home_price = selections['affordable_home_price']
+    married_score_table = rank_score_table(married_scoring_order, married_scoring_order[4])
+    children_score_table = rank_score_table(children_scoring_order, children_scoring_order[4])
+    school_enrollment_score_table = rank_score_table(school_enrollment_scoring_order, school_enrollment_scoring_order[4])
+    area_classification_score_table = rank_score_table(area_classification_scoring_order, area_classification_scoring_order[4])
+
+    # Each Component is Listed in the Order of the Total City Score
+    components = [
+        # ---- Home Value Score ----
+        ('Home_Value', (user_home_price,),
+            lambda city_rows: deviation_band_score(user_home_price, column_rows(zipcode_columns['Median_Home_Value'], city_rows), column_rows(zipcode_columns['MAD_Home_Value'], city_rows)),
+            None),
+
+        # ---- Household Income Score ----
+        ('Household_Income', (user_home_price,),
+            lambda city_rows: deviation_band_score(user_home_price, column_rows(zipcode_columns['Median_Household_Income'], city_rows), column_rows(zipcode_columns['MAD_Household_Income'], city_rows)),
+            None),
+
+        # ---- Married Score ----
+        ('Married', (selections['married'], married_importance),
+            lambda city_rows: married_score_table[column_rows(zipcode_columns['Married_Percentage'], city_rows)],
+            None),
+
+        # ---- Children Score ----
+        ('Children', (selections['children'], children_importance),
+            lambda city_rows: children_score_table[column_rows(zipcode_columns['Families_with_Children'], city_rows)],
+            None),
+
+        # ---- School Enrollment Score ----
+        ('School_Enrollment', (school_enrollment_importance,),
+            lambda city_rows: school_enrollment_score_table[column_rows(zipcode_columns['School_Enrollment_Percentage'], city_rows)],
+            None)
+    ]
+
+    # User Selected Employment Status
+    if selections['employed_status'] == 'No':
+        # ---- Regional Employment, Transportation Method, & Commute Score ----
+        regional_employment_importance = int(selections['regional_employment_importance'])
+        transportation_method = selections['work_transportation']
+        employment_score_table, transportation_score_table = work_score_tables(regional_employment_importance, transportation_method)
+        transportation_column = work_transportation_column(transportation_method)
+        components.append(('Work', (str(selections['regional_employment_importance']), transportation_method, user_commute_time),
+            lambda city_rows: work_score(dataset, regional_employment_importance, transportation_method, user_commute_time, city_rows),
+            # Commute Score is at Most 4 Points
+            lambda city_rows: employment_score_table[column_rows(zipcode_columns['Employment_Percentage'], city_rows)]
+                + (transportation_score_table[column_rows(zipcode_columns[transportation_column], city_rows)] if transportation_column else 0.0)
+                + (4.0 if transportation_method != 'Work From Home' else 0.0)))
+        max_employment_score = regional_employment_importance
+        max_transportation_score = 4 if transportation_method in ["Personal Vehicle", "Public Transportation", "Walking or Biking"] else 0
+
+        if transportation_method != 'Work From Home':
+            # Max Commute Score Follows the Final City Searched
+            final_city_commute_time = zipcode_columns['Travel_Time_To_Work'][rows[-1]] if len(rows) else np.nan
+            max_commute_score = 4 if final_city_commute_time and not np.isnan(final_city_commute_time) else 0
+        else:
+            max_commute_score = 5
+
+        # Max Possible Work Score
+        max_work_score = max_employment_score + max_transportation_score + max_commute_score
+    else:
+        components.append(('Work', (selections['employed_status'],),
+            lambda city_rows: np.zeros(len(dataset.city_name_list) if city_rows is None else len(city_rows)),
+            None))
+        max_work_score = 0
+
+    # ---- Education Level Score ----
+    components.append(('Education', (user_education_number, education_importance),
+        lambda city_rows: education_score(user_education_number, education_importance, column_rows(zipcode_columns['Education_Score'], city_rows)),
+        lambda city_rows: float(max(education_importance, 0))))
+
+    # ---- Area Classification Score ----
+    components.append(('Area_Classification', (living_enviornment, living_enviornment2),
+        lambda city_rows: area_classification_score_table[column_rows(zipcode_columns['Area_Classification'], city_rows)],
+        None))
+
+    # ---- Weather Score ----
+    city_weather_selections = weather_selections(selections)
+    prefix_weather_score = cache(lambda: zipcode_prefix_weather_score(dataset, city_weather_selections))
+    components.append(('Weather', city_weather_selections,
+        lambda city_rows: prefix_weather_score()[column_rows(zipcode_columns['Zipcode_Prefix_Index'], city_rows)],
+        None))
+
+    # ---- Natural Disaster Score ----
+    city_natural_disaster_selections = natural_disaster_selections(selections)
+    state_score = cache(lambda: state_natural_disaster_score(dataset, city_natural_disaster_selections))
+    components.append(('Natural_Disaster', city_natural_disaster_selections,
+        lambda city_rows: state_score()[column_rows(zipcode_columns['State_Index'], city_rows)],
+        None))
+
+    # Find Max Possible Score for Match Percentage
+    max_household_income = max_home_afforabilty = 10
+    max_education_score = education_importance
+    max_area_classification_score = max(living_enviornment_scoring_order1) + max(living_enviornment_scoring_order2)
+    max_possible_score = max_home_afforabilty + max_household_income + max(married_scoring_order) + max(children_scoring_order) + max(school_enrollment_scoring_order) + max_work_score + max_education_score + max_area_classification_score + max_possible_weather_score(city_weather_selections) + max_possible_natural_disaster_score(city_natural_disaster_selections)
+
+    return components, max_possible_score
+
+def prefix_scores(zipcode_prefix_index: np.ndarray, total_city_score: np.ndarray, zipcode_prefix_quantity: np.ndarray):
+    # Average City Score of Each Zipcode Prefix. Every City of a Zipcode Prefix Must be Included
+    zipcode_prefix_score_sum = np.bincount(zipcode_prefix_index, weights=total_city_score, minlength=len(zipcode_prefix_quantity))
+    return zipcode_prefix_score_sum / np.maximum(zipcode_prefix_quantity, 1)
+
+@instrumented('Score_Search')
+def score_search(dataset: IdealHomeDataset, selections: dict, rows: np.ndarray, component_score = uncached_component_score):
+    """
+        Combine All Scores of the Cities at the Rows into the Search Scores (See city_result & ranked_results)
+        Selections Hold the Profile Keys w/ the Affordable Home Price Resolved
+    """
+    # Columnar Data of Each City in the Search Results
+    zipcode_columns = dataset.zipcode_columns
+    zipcode_prefix_index = zipcode_columns['Zipcode_Prefix_Index'][rows]
+    user_home_price = selections['affordable_home_price']
+    components, max_possible_score = search_components(dataset, selections, rows)
+
+    # Each Component is Scored Once for Every City & Requested by the Selections it Depends On
+    # A Caching component_score Only Recalculates Components w/ Changed Selections
+    component_scores = [component_score(component, cache_key, lambda score_function=score_function: score_function(None)) for component, cache_key, score_function, _ in components]
+    unlikely_to_afford_warning = component_score('Afforability_Warning', (user_home_price,), lambda:
+        affordability_warning_mask(user_home_price, zipcode_columns['Median_Home_Value'], zipcode_columns['MAD_Home_Value']))
+
+    # Total City Score of the Cities in the Search Results
+    dataset.instrumentation.count('Cities_Scored', len(rows))
+    with dataset.instrumentation.span('Total_City_Score', Cities_Scored=len(rows)):
+        total_city_score = component_scores[0][rows]
+        for city_component_score in component_scores[1:]:
+            total_city_score = total_city_score + city_component_score[rows]
+        unlikely_to_afford_warning = unlikely_to_afford_warning[rows]
+
+    # Average Data to Find Zipcode Prefix Score
+    with dataset.instrumentation.span('Zipcode_Prefix_Score'):
+        zipcode_prefix_quantity = np.bincount(zipcode_prefix_index, minlength=len(dataset.zipcode_prefix_list))
+        final_zipcode_prefix_score = prefix_scores(zipcode_prefix_index, total_city_score, zipcode_prefix_quantity)
+
+        # Combined City Score and Zipcode Prefix Score
+        final_city_score = total_city_score + final_zipcode_prefix_score[zipcode_prefix_index]
+
+    return {
+        'Rows': rows,
+        'Total_City_Score': total_city_score,
+        'Final_City_Score': final_city_score,
+        'Zipcode_Prefix_Index': zipcode_prefix_index,
+        'Zipcode_Prefix_Score': final_zipcode_prefix_score,
+        'Zipcode_Prefix_Quantity': zipcode_prefix_quantity,
+        'Afforability_Warning': unlikely_to_afford_warning,
+        'Max_Possible_Score': max_possible_score
+    }
+
+@instrumented('Bounded_Score_Search')
+def bounded_score_search(dataset: IdealHomeDataset, selections: dict, rows: np.ndarray, top_n: int = 1, batch_cities: int = 1024):
+    """
+        Branch & Bound Search for the Top N Cities of the Cities at the Rows, w/ the Same Top N as score_search
+        Returns Search Scores of Only the Cities Scored, in Row Order (See city_result & top_k_indexes)
+
+        A City's Final Score is its City Score Plus the Average City Score of its Zipcode Prefix. Bounding Each City Score
+        w/ the Cheap Upper Bounds of the Components Bounds the Final Scores of a Zipcode Prefix by its Highest Plus its
+        Average City Bound. Zipcode Prefixes are Scored Whole, in Descending Order of that Bound, Until No Remaining
+        Zipcode Prefix can Beat the N-th Best Final City Score
+    """
+    zipcode_columns = dataset.zipcode_columns
+    zipcode_prefix_index = zipcode_columns['Zipcode_Prefix_Index'][rows]
+    user_home_price = selections['affordable_home_price']
+    components, max_possible_score = search_components(dataset, selections, rows)
+
+    # Upper Bound of the Final City Score in Each Zipcode Prefix
+    zipcode_prefix_quantity = np.bincount(zipcode_prefix_index, minlength=len(dataset.zipcode_prefix_list))
+    with dataset.instrumentation.span('Zipcode_Prefix_Bound'):
+        # Components w/o an Upper Bound are Scored for Every City Once & Reused by the Zipcode Prefixes Scored
+        exact_scores = {component: score_function(rows) for component, _, score_function, upper_bound in components if upper_bound is None}
+        city_score_bound = np.zeros(len(rows))
+        for component, _, _, upper_bound in components:
+            city_score_bound += exact_scores[component] if upper_bound is None else upper_bound(rows)
+        best_city_score_bound = np.full(len(zipcode_prefix_quantity), -np.inf)
+        np.maximum.at(best_city_score_bound, zipcode_prefix_index, city_score_bound)
+        final_score_bound = best_city_score_bound + prefix_scores(zipcode_prefix_index, city_score_bound, zipcode_prefix_quantity)
+        # Tolerance for the Summation Order of the Bound
+        final_score_bound += 1e-6
+
+    # Zipcode Prefixes in Descending Bound Order & the Positions of Their Cities Grouped in that Order
+    searched_zipcode_prefixes = np.flatnonzero(zipcode_prefix_quantity)
+    searched_zipcode_prefixes = searched_zipcode_prefixes[np.argsort(-final_score_bound[searched_zipcode_prefixes], kind='stable')]
+    visit_order = np.zeros(len(zipcode_prefix_quantity), dtype=np.int16 if len(zipcode_prefix_quantity) < 2 ** 15 else np.int32)
+    visit_order[searched_zipcode_prefixes] = np.arange(len(searched_zipcode_prefixes))
+    city_positions = np.argsort(visit_order[zipcode_prefix_index], kind='stable')
+    prefix_ends = np.cumsum(zipcode_prefix_quantity[searched_zipcode_prefixes])
+
+    # Top N Candidates: Positions of the Rows & Final City Scores
+    candidate_positions = np.array([], dtype=np.int64)
+    candidate_scores = np.array([], dtype=np.float64)
+    scored_positions, scored_total_scores = [], []
+    prefixes_scored = cities_scored = 0
+    while prefixes_scored < len(searched_zipcode_prefixes):
+        if len(candidate_scores) >= top_n:
+            # Skip the Zipcode Prefixes that Cannot Beat the N-th Best Final City Score
+            threshold = np.partition(candidate_scores, len(candidate_scores) - top_n)[len(candidate_scores) - top_n]
+            if final_score_bound[searched_zipcode_prefixes[prefixes_scored]] < threshold:
+                break
+
+        # Next Batch of Whole Zipcode Prefixes, Doubling Each Pass
+        batch_end = int(np.searchsorted(prefix_ends, cities_scored + (batch_cities << min(len(scored_positions), 8)), side='left'))
+        batch_end = min(max(batch_end, prefixes_scored + 1), len(searched_zipcode_prefixes))
+        positions = np.sort(city_positions[cities_scored:prefix_ends[batch_end - 1]])
+        prefixes_scored, cities_scored = batch_end, int(prefix_ends[batch_end - 1])
+
+        # Same Summation Order as score_search
+        city_rows = rows[positions]
+        component_scores = [exact_scores[component][positions] if component in exact_scores else score_function(city_rows) for component, _, score_function, _ in components]
+        total_city_score = component_scores[0]
+        for city_component_score in component_scores[1:]:
+            total_city_score = total_city_score + city_component_score
+        final_city_score = total_city_score + prefix_scores(zipcode_prefix_index[positions], total_city_score, zipcode_prefix_quantity)[zipcode_prefix_index[positions]]
+        scored_positions.append(positions)
+        scored_total_scores.append(total_city_score)
+
+        # Keep Every Candidate Tied w/ the N-th Best
+        candidate_positions = np.concatenate([candidate_positions, positions])
+        candidate_scores = np.concatenate([candidate_scores, final_city_score])
+        if len(candidate_scores) > top_n:
+            keep = candidate_scores >= np.partition(candidate_scores, len(candidate_scores) - top_n)[len(candidate_scores) - top_n]
+            candidate_positions, candidate_scores = candidate_positions[keep], candidate_scores[keep]
+
+    dataset.instrumentation.count('Cities_Scored', cities_scored)
+    dataset.instrumentation.count('Zipcode_Prefixes_Pruned', len(searched_zipcode_prefixes) - prefixes_scored)
+
+    # Search Scores of the Scored Cities in Row Order, so Ties Keep the Order of score_search
+    scored_positions, scored_total_scores = np.concatenate(scored_positions), np.concatenate(scored_total_scores)
+    row_order = np.argsort(scored_positions, kind='stable')
+    scored_positions, total_city_score = scored_positions[row_order], scored_total_scores[row_order]
+    scored_zipcode_prefix_index = zipcode_prefix_index[scored_positions]
+    final_zipcode_prefix_score = prefix_scores(scored_zipcode_prefix_index, total_city_score, zipcode_prefix_quantity)
+    scored_rows = rows[scored_positions]
+
+    return {
+        'Rows': scored_rows,
+        'Total_City_Score': total_city_score,
+        'Final_City_Score': total_city_score + final_zipcode_prefix_score[scored_zipcode_prefix_index],
+        'Zipcode_Prefix_Index': scored_zipcode_prefix_index,
+        'Afforability_Warning': affordability_warning_mask(user_home_price, zipcode_columns['Median_Home_Value'][scored_rows], zipcode_columns['MAD_Home_Value'][scored_rows]),
+        'Max_Possible_Score': max_possible_score
+    }
+
+# -------------- Results -------------------
+def top_city_result(dataset: IdealHomeDataset, search_scores: dict):
+    # Top Matching City
+    with dataset.instrumentation.span('Top_K'):
+        top_index = top_k_indexes(search_scores['Final_City_Score'], limit=1)[0]
+
+    return city_result(dataset, search_scores, top_index)
+
+def ranked_results(dataset: IdealHomeDataset, search_scores: dict, limit: int = 10, offset: int = 0, region_limit: int = 5, region_offset: int = 0):
+    """
+        Page Through the Top Cities & Top Zipcode Prefix Regions of the Search Scores
+        Partial Selection Avoids a Full Sort of Every City Searched
+    """
+    # Top Matching Cities
+    city_indexes = top_k_indexes(search_scores['Final_City_Score'], limit=limit, offset=offset)
+
+    # Top Matching Regions - Only Zipcode Prefixes in the Search Results
+    searched_zipcode_prefixes = np.flatnonzero(search_scores['Zipcode_Prefix_Quantity'])
+    region_indexes = searched_zipcode_prefixes[top_k_indexes(search_scores['Zipcode_Prefix_Score'][searched_zipcode_prefixes], limit=region_limit, offset=region_offset)]
+
+    return {
+        'Top_Cities': [city_result(dataset, search_scores, index) for index in city_indexes],
+
+        'Top_Regions': [region_result(dataset, search_scores, zipcode_prefix_index) for zipcode_prefix_index in region_indexes],
+
+        'Total_Cities': len(search_scores['Rows']),
+
+        'Total_Regions': len(searched_zipcode_prefixes)
+    }
+
+def city_result(dataset: IdealHomeDataset, search_scores: dict, index: int):
+    # City Data at the Index of the Search Scores
+    row = search_scores['Rows'][index]
+    city_name = dataset.city_name_list[row]
+    zipcode_prefix = dataset.zipcode_prefix_list[search_scores['Zipcode_Prefix_Index'][index]]
+    match_percentage = round(search_scores['Total_City_Score'][index] * 100 / search_scores['Max_Possible_Score'])
+
+    # Matching Region
+    region_name = dataset.zipcode_prefix_region_names[zipcode_prefix]
+
+    # Resulting State
+    state = region_name[-2:]
+
+    return {
+        'Result_City': f"{city_name.split(',')[0]}, {state}",
+
+        'Result_City_Coordinates': dataset.zipcode_coordinates[row].tolist(),
+
+        'Match_Percentage': int(match_percentage),
+
+        'Region_Name': f'{region_name.title()[:-3]}, {states_abbreviation_list[state]}',
+
+        'Zipcode_Prefix_Boundary': dataset.zipcode_prefix_boundary_data[zipcode_prefix],
+
+        'Afforability_Warning': bool(search_scores['Afforability_Warning'][index])
+    }
+
+def region_result(dataset: IdealHomeDataset, search_scores: dict, zipcode_prefix_index: int):
+    # Zipcode Prefix Data at the Index of the Zipcode Prefix List
+    zipcode_prefix = dataset.zipcode_prefix_list[zipcode_prefix_index]
+    region_name = dataset.zipcode_prefix_region_names[zipcode_prefix]
+    state = region_name[-2:]
+
+    return {
+        'Zipcode_Prefix': zipcode_prefix,
+
+        'Region_Name': f'{region_name.title()[:-3]}, {states_abbreviation_list[state]}',
+
+        'Match_Percentage': int(round(search_scores['Zipcode_Prefix_Score'][zipcode_prefix_index] * 100 / search_scores['Max_Possible_Score'])),
+
+        'Cities_Searched': int(search_scores['Zipcode_Prefix_Quantity'][zipcode_prefix_index]),
+
+        'Zipcode_Prefix_Boundary': dataset.zipcode_prefix_boundary_data[zipcode_prefix]
+    }
+
+@instrumented('Score_Profile')
+def score_profile(dataset: IdealHomeDataset, profile: dict, top_n: int = 0, component_score = uncached_component_score):
+    """
+        Score a Complete Profile. Returns (Result, Errors)
+        Result is the Top City (See city_result), Plus the Top N Cities if top_n is Set. None if there are Errors
+    """
+    # Family & Work Locations
+    coordinates_list, errors = resolve_profile_locations(dataset, profile)
+    if errors:
+        return None, errors
+
+    rows, errors = location_radius_rows(dataset, coordinates_list, int(profile.get('radius_index', 2)))
+    if errors:
+        return None, errors
+
+    selections = {**profile, 'affordable_home_price': profile_home_price(profile)}
+    if profile.get('hard_constraints'):
+        # Only Score the Cities Satisfying the Hard Constraints (See Constraint Index)
+        with dataset.instrumentation.span('Hard_Constraints'):
+            rows = dataset.constraint_index.filter_rows(profile['hard_constraints'], selections['affordable_home_price'], rows)
+        dataset.instrumentation.count('Cities_After_Constraints', len(rows))
+        if len(rows) < 1:
+            return None, ['Zero cities satisfy the hard constraints. Please relax the constraints or alter distance or city selections.']
+
+    if component_score is uncached_component_score:
+        # Nothing to Reuse, so Only Score the Zipcode Prefixes that can Reach the Top N
+        search_scores = bounded_score_search(dataset, selections, rows, top_n=max(top_n, 1))
+    else:
+        search_scores = score_search(dataset, selections, rows, component_score)
+
+    result = top_city_result(dataset, search_scores)
+    if top_n:
+        result['Top_Cities'] = [city_result(dataset, search_scores, index) for index in top_k_indexes(search_scores['Final_City_Score'], limit=top_n)]
+
+    return result, []
@@ -0,0 +1,170 @@
+import argparse, itertools, json, statistics, time
+from runtime.data_analysis import IdealHomeDataAnalysis
+from runtime.profile_scoring import score_profile
+from runtime.startup_benchmark import percentile, git_commit
+"""
+    Scoring Microbenchmarks for IdealHomeDataAnalysis
+
+    Usage (From the Project Folder):
+        python -m runtime.scoring_benchmark --repeat 3 --output scoring.json
+
+    Times Each Scoring Stage Separately & End to End (score_profile) over a Fixed Corpus of Profiles
+    Covering Every Branch: No Location, Single Location w/ 200 Mile Radius, & Three Locations w/ 40 Mile Radius,
+    Employed & Not Employed, Each Transportation Method, & 1, 2, or 4 Seasons.
+
+    Caches are Cleared Before Each Timed Call, so Every Stage is Measured Cold.
+    Results_Frame_7_Cached Repeats the Results Step w/ Unchanged Selections to Measure the Component Cache.
+    Score_Profile_Bounded Times the Stateless score_profile, which Prunes Zipcode Prefixes (See bounded_score_search).
+"""
+
+corpus_locations = [
+    ({}, 5),
+    ({'family_location': {'state': 'Texas', 'city': 'Austin'}}, 5),
+    ({'family_location': {'state': 'NY', 'city': 'Buffalo'}, 'family_location2': {'state': 'PA', 'city': 'Erie'}, 'work_location': {'zipcode': '44102'}}, 2)
+]
+corpus_employment = ['Yes', 'No']
+corpus_transportation = ["Personal Vehicle", "Public Transportation", "Walking or Biking", "Work From Home"]
+corpus_seasons = ["1 Season", "2 Seasons", "4 Seasons"]
+living_enviornment_options = ["Hyper Rural", "Rural", "Suburban", "Urban", "Hyper Urban"]
+level_options = ["Very Low", "Low", "Average", "High", "Very High"]
+education_options = ["Less than High School", "High School", "Associate's", "Bachelor's", "Master's", "Doctorate"]
+commute_options = ["Under 10 Minutes", "Under 20 Minutes", "Under 30 Minutes", "Under 40 Minutes", "Under 50 Minutes"]
+disaster_options = ["Hurricane", "Tornado", "Thunderstorm", "Earthquake", "Wildfire", "Flood"]
+
+stages = ['City_Name_Zipcode_Matcher', 'Run_Location_Radius_Search', 'Calculate_Affordable_Home_Price', 'Weather_Frame_5', 'Natural_Disaster_Risk_Frame_6', 'Results_Frame_7', 'Results_Frame_7_Cached', 'End_To_End', 'Score_Profile_Bounded']
+
+
+def benchmark_profiles():
+    # Every Combination of the Branch Selections. Remaining Selections Cycle Deterministically
+    profiles = []
+    for index, ((locations, radius_index), employed_status, work_transportation, seasons) in enumerate(itertools.product(corpus_locations, corpus_employment, corpus_transportation, corpus_seasons)):
+        profiles.append({
+            **locations,
+            'radius_index': radius_index,
+            'married': ['Yes', 'No'][index % 2],
+            'married_importance': str(index % 5 + 1),
+            'children': ['Yes', 'No'][index // 2 % 2],
+            'children_importance': str((index + 1) % 5 + 1),
+            'school_enrollment_importance': str((index + 2) % 5 + 1),
+            'employed_status': employed_status,
+            'regional_employment_importance': str((index + 3) % 5 + 1),
+            'work_transportation': work_transportation,
+            'commute_time': commute_options[index % 5],
+            'income': str(40000 + 15000 * (index % 8)),
+            'percent_income_allocated': ["15%", "20%", "25%", "30%", "35%", "40%"][index % 6],
+            'interest_rate': 4.5 + index % 4,
+            'mortgage_term': ["15 Years", "30 Years"][index % 2],
+            'adjustments': ["-10%", "-5%", "No Change", "+5%", "+10%"][index % 5],
+            'education_level': education_options[index % 6],
+            'education_level_importance': str((index + 4) % 5 + 1),
+            'living_enviornment': living_enviornment_options[index % 5],
+            'living_enviornment2': living_enviornment_options[(index + 2) % 5],
+            'seasons': seasons,
+            'summer_temperature': str(65 + index % 30),
+            'winter_temperature': str(index % 50),
+            'precipitation_level': level_options[index % 5],
+            'sunshine_level': level_options[(index + 2) % 5],
+            'natural_disaster_risk': str(index % 5 + 1),
+            'disaster_to_avoid': disaster_options[index % 6],
+            'disaster_to_avoid2': disaster_options[(index + 1) % 6],
+            'disaster_to_avoid3': disaster_options[(index + 3) % 6]
+        })
+    return profiles
+
+def clear_caches(data_analysis: IdealHomeDataAnalysis):
+    data_analysis.component_score_cache.clear()
+    data_analysis.dataset.location_index.resolve_location.cache_clear()
+    data_analysis.dataset.location_index.resolve_state.cache_clear()
+
+def timed(stage_times: dict, stage: str, function, *args, **kwargs):
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    stage_times.setdefault(stage, []).append(time.perf_counter() - start_time)
+    return result
+
+def benchmark_profile(data_analysis: IdealHomeDataAnalysis, profile: dict, stage_times: dict):
+    # Same Steps as score_profile, w/ Each Hot Path Timed Separately
+    clear_caches(data_analysis)
+    data_analysis.reset_selections()
+    for index, location_key in enumerate(['family_location', 'family_location2', 'work_location']):
+        location = profile.get(location_key)
+        if location:
+            timed(stage_times, 'City_Name_Zipcode_Matcher', data_analysis.city_name_zipcode_matcher, state=location.get('state', ''), city=location.get('city', ''), zipcode=location.get('zipcode', ''), index=index)
+
+    timed(stage_times, 'Run_Location_Radius_Search', data_analysis.run_location_radius_search, radius_index=profile['radius_index'])
+    data_analysis.family_details_frame_1b(married=profile['married'], married_importance=profile['married_importance'], children=profile['children'],
+        children_importance=profile['children_importance'], school_enrollment_importance=profile['school_enrollment_importance'])
+    data_analysis.work_frame_2(employed_status=profile['employed_status'], radius_index=profile['radius_index'], regional_employment_importance=profile['regional_employment_importance'],
+        work_transportation=profile['work_transportation'], commute_time=profile['commute_time'])
+
+    affordable_home_price = timed(stage_times, 'Calculate_Affordable_Home_Price', data_analysis.calculate_affordable_home_price, income=float(profile['income']),
+        percent_income_allocated=profile['percent_income_allocated'], interest_rate=float(profile['interest_rate']), mortgage_term=profile['mortgage_term'], adjustments=profile['adjustments'])
+    data_analysis.income_frame_3(income=profile['income'], affordable_home_price=float(affordable_home_price))
+    data_analysis.area_classification_frame_4(education_level=profile['education_level'], education_level_importance=profile['education_level_importance'],
+        living_enviornment=profile['living_enviornment'], living_enviornment2=profile['living_enviornment2'])
+
+    timed(stage_times, 'Weather_Frame_5', data_analysis.weather_frame_5, seasons=profile['seasons'], summer_temperature=profile['summer_temperature'],
+        winter_temperature=profile['winter_temperature'], precipitation_level=profile['precipitation_level'], sunshine_level=profile['sunshine_level'])
+    timed(stage_times, 'Natural_Disaster_Risk_Frame_6', data_analysis.natural_disaster_risk_frame_6, natural_disaster_risk=profile['natural_disaster_risk'],
+        disaster_to_avoid=profile['disaster_to_avoid'], disaster_to_avoid2=profile['disaster_to_avoid2'], disaster_to_avoid3=profile['disaster_to_avoid3'])
+
+    result = timed(stage_times, 'Results_Frame_7', data_analysis.results_frame_7)
+    timed(stage_times, 'Results_Frame_7_Cached', data_analysis.results_frame_7)
+
+    clear_caches(data_analysis)
+    timed(stage_times, 'End_To_End', data_analysis.score_profile, profile)
+
+    clear_caches(data_analysis)
+    timed(stage_times, 'Score_Profile_Bounded', score_profile, data_analysis.dataset, profile)
+    return result
+
+def stage_summary(times: list):
+    return {
+        'Calls': len(times),
+        'Ops_Per_Second': len(times) / sum(times) if sum(times) else None,
+        'Mean_ms': statistics.mean(times) * 1000,
+        'P50_ms': percentile(times, 50) * 1000,
+        'P95_ms': percentile(times, 95) * 1000,
+        'P99_ms': percentile(times, 99) * 1000,
+        'Max_ms': max(times) * 1000
+    }
+
+def run_scoring_benchmark(repeat: int = 3, warmup: int = 1):
+    data_analysis = IdealHomeDataAnalysis()
+    profiles = benchmark_profiles()
+
+    # Warmup Loads Every Dataset & Builds the Indexes
+    for _ in range(warmup):
+        for profile in profiles:
+            benchmark_profile(data_analysis, profile, {})
+
+    stage_times = {}
+    for _ in range(repeat):
+        for profile in profiles:
+            benchmark_profile(data_analysis, profile, stage_times)
+
+    return {
+        'Commit': git_commit(),
+        'Profiles': len(profiles),
+        'Repeat': repeat,
+        'Stages': {stage: stage_summary(stage_times[stage]) for stage in stages if stage in stage_times}
+    }
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Time each IdealHomeDataAnalysis scoring stage over a fixed profile corpus.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes over the corpus')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed passes before the timed passes')
+    parser.add_argument('--output', default=None, help='Write the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = run_scoring_benchmark(args.repeat, args.warmup)
+    print(f"{'Stage':<32}{'Ops/s':>10}{'P50 ms':>10}{'P95 ms':>10}{'P99 ms':>10}")
+    for stage, summary in results['Stages'].items():
+        print(f"{stage:<32}{summary['Ops_Per_Second']:>10.0f}{summary['P50_ms']:>10.3f}{summary['P95_ms']:>10.3f}{summary['P99_ms']:>10.3f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import argparse, json, os, signal, sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from runtime.dataset import IdealHomeDataset
+from runtime.profile_scoring import affordable_home_price, distance_to_center, resolve_location, score_profile
+"""
+    Local HTTP Scoring Service (Standard Library Only)
+
+    Usage (From the Project Folder):
+        python -m runtime.scoring_service --port 8080 --processes 4
+
+    Endpoints (JSON Request & Response Bodies):
+        GET  /health          {'Status': 'OK'}
+        POST /resolve         {'state', 'city', 'zipcode'} -> {'Result', 'Coordinates'}
+        POST /affordability   {'income', 'percent_income_allocated', 'interest_rate', 'mortgage_term', 'adjustments'} -> {'Affordable_Home_Price'}
+        POST /distance        {'locations': [{'state', 'city', 'zipcode'}, ...]} -> {'Distance_To_Center'}
+        POST /score           Complete Profile (See Profile Scoring score_profile), Optional 'top_n' -> Top Result & Top Cities
+    Invalid Requests Return Status 400 w/ {'Errors': [...]}
+
+    The Dataset is Loaded Once per Process & Shared by Every Request Thread w/o Locks, Since Scoring is a
+    Pure Function of the Read-Only Dataset & the Request. With --processes, Forked Workers Accept on One
+    Socket & Share the Memory Mapped Data Bundle, so Scoring Scales w/ the Number of Cores.
+"""
+
+max_request_bytes = 1024 * 1024
+
+
+class ScoringService():
+
+    def __init__(self, dataset: IdealHomeDataset = None):
+        # Load Every Dataset Before the First Request
+        self.dataset = (dataset or IdealHomeDataset()).load()
+
+    def resolve(self, request: dict):
+        result, coordinates = resolve_location(self.dataset, state=request.get('state', ''), city=request.get('city', ''), zipcode=request.get('zipcode', ''))
+        if not coordinates:
+            return 400, {'Errors': [result]}
+        return 200, {'Result': result, 'Coordinates': coordinates}
+
+    def affordability(self, request: dict):
+        home_price = affordable_home_price(income=float(request['income']),
+            percent_income_allocated=request['percent_income_allocated'],
+            interest_rate=float(request['interest_rate']),
+            mortgage_term=request['mortgage_term'],
+            adjustments=request.get('adjustments', 'No Change'))
+        return 200, {'Affordable_Home_Price': home_price}
+
+    def distance(self, request: dict):
+        coordinates_list = []
+        for location in request.get('locations', []):
+            result, coordinates = resolve_location(self.dataset, state=location.get('state', ''), city=location.get('city', ''), zipcode=location.get('zipcode', ''))
+            if not coordinates:
+                return 400, {'Errors': [result]}
+            coordinates_list.append(coordinates)
+
+        return 200, {'Distance_To_Center': distance_to_center(coordinates_list)}
+
+    def score(self, request: dict):
+        result, errors = score_profile(self.dataset, request, top_n=int(request.get('top_n', 0)))
+        if errors:
+            return 400, {'Errors': errors}
+        return 200, result
+
+    def handle(self, path: str, request: dict):
+        endpoints = {'/resolve': self.resolve, '/affordability': self.affordability, '/distance': self.distance, '/score': self.score}
+        if path not in endpoints:
+            return 404, {'Errors': [f'Unknown Endpoint: {path}']}
+        try:
+            return endpoints[path](request)
+        # Missing Fields & Wrong Field Types, e.g. a Number Where a Selection String is Expected
+        except (KeyError, ValueError, TypeError, AttributeError, IndexError) as e:
+            return 400, {'Errors': [f'Invalid Request: {e!r}']}
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    # Keep-Alive Connections Avoid a TCP Handshake per Request
+    protocol_version = 'HTTP/1.1'
+
+    def send_json(self, status: int, response: dict):
+        response_body = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.send_json(200, {'Status': 'OK'})
+        else:
+            self.send_json(404, {'Errors': [f'Unknown Endpoint: {self.path}']})
+
+    def do_POST(self):
+        content_length = int(self.headers.get('Content-Length', 0))
+        if content_length > max_request_bytes:
+            self.close_connection = True
+            self.send_json(413, {'Errors': ['Request Too Large']})
+            return
+        try:
+            request = json.loads(self.rfile.read(content_length) or b'{}')
+        except ValueError:
+            self.send_json(400, {'Errors': ['Request Body is Not Valid JSON']})
+            return
+        if not isinstance(request, dict):
+            self.send_json(400, {'Errors': ['Request Body Must be a JSON Object']})
+            return
+
+        # Scoring Service of the Server Process (See serve)
+        self.send_json(*self.server.scoring_service.handle(self.path, request))
+
+    def log_message(self, format, *args):
+        # Request Logging Costs More than Scoring
+        pass
+
+def serve(host: str = '127.0.0.1', port: int = 8080, processes: int = 1):
+    server = ThreadingHTTPServer((host, port), ScoringRequestHandler)
+    server.daemon_threads = True
+
+    # Forked Workers Accept on the Listening Socket of the Parent
+    worker_pids = []
+    if processes > 1 and hasattr(os, 'fork'):
+        for _ in range(processes - 1):
+            pid = os.fork()
+            if pid == 0:
+                worker_pids = []
+                break
+            worker_pids.append(pid)
+
+    # Each Process Loads the Dataset Once, After Forking
+    server.scoring_service = ScoringService()
+    # Stopping the Parent Stops the Workers
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    print(f'Process {os.getpid()} serving on http://{host}:{server.server_address[1]}', file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for pid in worker_pids:
+            try:
+                os.kill(pid, 15)
+            except OSError:
+                pass
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Serve location resolution, affordability, distance, and profile scoring as JSON over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port (default: 8080)')
+    parser.add_argument('--processes', type=int, default=1, help='Worker processes sharing the socket (POSIX only)')
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.processes)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse, json, math, os, platform, shutil, statistics, subprocess, sys, time
+from runtime.import_budget import import_budget_report
+"""
+    Startup & Time to Interactive Benchmark
+
+    Usage (From the Project Folder):
+        python -m runtime.startup_benchmark --repeat 10 --output startup.json
+        python -m runtime.startup_benchmark --data-only      (No Display Required)
+
+    Each Run Starts a Fresh Interpreter and Records the Seconds from Interpreter Start to:
+        Imported: runtime.gui Imported
+        App_Constructed: gui.App() Returned
+        First_Frame_Mapped: Main Window Viewable
+        Data_Ready: IdealHomeDataAnalysis Loaded & the Get Started Button Enabled
+    The --data-only Mode Skips the GUI and Times the Same Data Loading the App Runs in its Worker Thread.
+
+    Without a Display, the GUI Runs are Wrapped in xvfb-run when it is Installed.
+    Results (Median, P95, Peak RSS, Import Cost by Package) are Written as JSON for Comparison Between Commits.
+"""
+
+gui_stages = ['Imported', 'App_Constructed', 'First_Frame_Mapped', 'Data_Ready']
+data_only_stages = ['Imported', 'Data_Ready']
+
+
+def peak_rss_mb():
+    # Peak Resident Memory of this Process. None where the Resource Module is Unavailable (Windows)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, Kilobytes on Linux
+    return peak_rss / 1e6 if sys.platform == 'darwin' else peak_rss / 1e3
+
+def run_child(data_only: bool):
+    # Benchmarked Process: Prints the Stage Times as JSON on the Last Line of Stdout
+    start_time = float(os.environ['IDEAL_HOME_BENCHMARK_START'])
+    stage_times = {}
+
+    if data_only:
+        from runtime.data_analysis import IdealHomeDataAnalysis
+        stage_times['Imported'] = time.time() - start_time
+        data_analysis = IdealHomeDataAnalysis()
+        # Data Needed by the Location Frames (See App.load_data_analysis)
+        data_analysis.dataset.location_index
+        data_analysis.dataset.zipcode_spatial_index
+        stage_times['Data_Ready'] = time.time() - start_time
+    else:
+        from runtime import gui
+        stage_times['Imported'] = time.time() - start_time
+        app = gui.App()
+        stage_times['App_Constructed'] = time.time() - start_time
+        while not app.winfo_viewable():
+            app.update()
+        stage_times['First_Frame_Mapped'] = time.time() - start_time
+        while app.IdealHomeDataAnalysis is None:
+            if time.time() - start_time > 120:
+                raise TimeoutError('Data analysis not loaded within 120s')
+            app.update()
+            time.sleep(0.001)
+        stage_times['Data_Ready'] = time.time() - start_time
+        app.destroy()
+
+    print(json.dumps({'Stage_Seconds': stage_times, 'Peak_RSS_MB': peak_rss_mb()}))
+
+def run_once(data_only: bool):
+    command = [sys.executable, '-m', 'runtime.startup_benchmark', '--child']
+    if data_only:
+        command.append('--data-only')
+    elif not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        if not shutil.which('xvfb-run'):
+            raise RuntimeError('No display available. Install Xvfb (xvfb-run) or use --data-only')
+        command = ['xvfb-run', '-a', *command]
+
+    process = subprocess.run(command, capture_output=True, text=True, env={**os.environ, 'IDEAL_HOME_BENCHMARK_START': repr(time.time())})
+    if process.returncode != 0:
+        raise RuntimeError(f'Benchmark run failed:\n{process.stderr}')
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def percentile(values: list, percent: float):
+    # Nearest Rank Percentile
+    sorted_values = sorted(values)
+    return sorted_values[max(0, math.ceil(len(sorted_values) * percent / 100) - 1)]
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_startup_benchmark(repeat: int = 10, data_only: bool = False, warmup: int = 1):
+    # Warmup Runs Fill the OS File Cache & the Bytecode Cache
+    for _ in range(warmup):
+        run_once(data_only)
+    runs = [run_once(data_only) for _ in range(repeat)]
+
+    stages = data_only_stages if data_only else gui_stages
+    peak_rss_values = [run['Peak_RSS_MB'] for run in runs if run['Peak_RSS_MB'] is not None]
+    return {
+        'Commit': git_commit(),
+        'Python': platform.python_version(),
+        'Platform': platform.platform(),
+        'Mode': 'Data_Only' if data_only else 'GUI',
+        'Repeat': repeat,
+        'Stages': {stage: {
+            'Median_Seconds': statistics.median(run['Stage_Seconds'][stage] for run in runs),
+            'P95_Seconds': percentile([run['Stage_Seconds'][stage] for run in runs], 95),
+            'Min_Seconds': min(run['Stage_Seconds'][stage] for run in runs)
+        } for stage in stages},
+        'Peak_RSS_MB': max(peak_rss_values) if peak_rss_values else None,
+        'Import_Cost': import_budget_report('runtime.data_analysis' if data_only else 'runtime.gui', repeat=3),
+        'Runs': runs
+    }
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Measure the time until the app is usable in fresh interpreters.')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs before the timed runs')
+    parser.add_argument('--data-only', action='store_true', help='Time the data loading without the GUI')
+    parser.add_argument('--output', default=None, help='Write the results as JSON')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.data_only)
+        return
+
+    results = run_startup_benchmark(args.repeat, args.data_only, args.warmup)
+    print(f"{'Stage':<24}{'Median s':>10}{'P95 s':>10}")
+    for stage, stage_results in results['Stages'].items():
+        print(f"{stage:<24}{stage_results['Median_Seconds']:>10.3f}{stage_results['P95_Seconds']:>10.3f}")
+    if results['Peak_RSS_MB'] is not None:
+        print(f"Peak RSS {results['Peak_RSS_MB']:.0f} MB")
+    print(f"Import {results['Import_Cost']['Module']} {results['Import_Cost']['Total_ms']:.0f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,17 @@
-from math import cos, pi
+import numpy as np
+from math import pi
 """
     ## Calculation Utilities
     - Reusable Functions for the Data Analysis Class
+    - Batch Functions Compute the Distances of a Whole Coordinate Column in One Vectorized Call
 
     Constants:
     1 Degree of Latitude is 69 Miles
     1 Degree of Longitude is cosine(Degree of Latitude) * 69 Miles
 """
 miles_per_degree_lat = 69
+# Only Center Point of Zipcodes are stored as Lat & Lng Coordinates
+radius_safety_factor = 1.05
 
 def find_centroid(c_1: list, c_2: list, c_3: list = []):
     if c_3:
@@ -20,60 +24,71 @@ def find_centroid(c_1: list, c_2: list, c_3: list = []):
     return [centroid_latitude, 
         centroid_longitiude]
 
-def find_hypotenuse(c_1: list, c_2: list):
-    # Calculate Differences For Latitude & Longitude
-    coordinate_1_2_lat_difference = abs(c_1[0] - c_2[0]) * miles_per_degree_lat
-    average_latitude_radians = (c_1[0] + c_2[0]) * pi / 360
-    miles_per_degree_lng = cos(average_latitude_radians) * miles_per_degree_lat
-    coordinate_1_2_lng_difference = abs(c_1[1] - c_2[1]) * miles_per_degree_lng
-
-    # Calculate Distance w/ Pythagorean theorem
-    distance = (coordinate_1_2_lat_difference ** 2 + coordinate_1_2_lng_difference ** 2) ** (1/2)
-
-    return distance
-
 def check_coordinates_distance_to_center(*args):
+    anchor_coordinates = np.array(args, dtype=np.float64)
  
     if len(args) == 2:
-        c_1_2_hypotenuse = find_hypotenuse(c_1=args[0], c_2=args[1])
+        c_1_2_hypotenuse = batch_find_hypotenuse(precompute_coordinate_table(anchor_coordinates[:1]), anchor_coordinates[1])[0]
         # Middle Distance in Miles
         distance_to_center = round(c_1_2_hypotenuse / 2)
     else:
-        centroid_coordinates = find_centroid(c_1=args[0], c_2=args[1], c_3=args[2])
-
-        c_1_centroid_distance = find_hypotenuse(c_1=args[0], c_2=centroid_coordinates)
-        c_2_centroid_distance = find_hypotenuse(c_1=args[1], c_2=centroid_coordinates)
-        c_3_centroid_distance = find_hypotenuse(c_1=args[2], c_2=centroid_coordinates)
+        centroid_coordinates = batch_find_centroid(anchor_coordinates)
+        # Furthest Location from the Centroid
+        centroid_distances = batch_find_hypotenuse(precompute_coordinate_table(anchor_coordinates), centroid_coordinates)
         
-        distance_to_center = round(max(c_1_centroid_distance, c_1_centroid_distance, c_3_centroid_distance))
+        distance_to_center = round(centroid_distances.max())
 
     return distance_to_center
 
-def location_radius_search(radius_distance: float, city_search_list: list, *args):
-    """ 
-        Add 5 % Safety Factor 
-        Rational: Only Center Point of Zipcodes are stored as Lat & Lng Coordinates 
+def precompute_coordinate_table(coordinates: np.ndarray):
+    """
+        Precompute Once per Dataset for the Batch Functions
+        The Cosine of the Average Latitude is Found from the Half Latitude Angles:
+        cos(a + b) = cos(a) * cos(b) - sin(a) * sin(b)
     """
-    radius_distance *= 1.05
+    half_latitude_radians = coordinates[:, 0] * pi / 360
 
-    # Initalize Data Storage
-    city_results_list = []
-    # Set Centriod Coordinates
-    if len(args) == 3:
-        centroid_coordinates = find_centroid(c_1=args[0], c_2=args[1], c_3=args[2])
-    elif len(args) == 2:
-        centroid_coordinates = find_centroid(c_1=args[0], c_2=args[1])
-    else:
-        centroid_coordinates = args[0]
+    return {
+        'Latitude': coordinates[:, 0],
+        'Longitude': coordinates[:, 1],
+        'Cos_Half_Latitude': np.cos(half_latitude_radians),
+        'Sin_Half_Latitude': np.sin(half_latitude_radians)
+    }
+
+def batch_find_centroid(anchor_coordinates: np.ndarray):
+    # Average of One or More [Latitude, Longitude] Anchor Points
+    return np.atleast_2d(anchor_coordinates).mean(axis=0)
+
+def batch_find_hypotenuse(coordinate_table: dict, anchor_coordinates: np.ndarray, rows: np.ndarray = None):
+    """
+        Distance in Miles from Each Coordinate to Each Anchor Point
+        Returns Shape (Coordinates,) for a Single Anchor or (Coordinates, Anchors) for Multiple Anchors
+        Optional Rows Limit the Calculation to a Subset of the Coordinate Table
+    """
+    single_anchor = np.ndim(anchor_coordinates) == 1
+    anchor_coordinates = np.atleast_2d(np.asarray(anchor_coordinates, dtype=np.float64))
+    anchor_half_latitude_radians = anchor_coordinates[:, 0] * pi / 360
 
-    # Check Each City
-    for city in city_search_list:
-        city_coordinates = [*city.values()][0]
+    latitude, longitude = coordinate_table['Latitude'], coordinate_table['Longitude']
+    cos_half_latitude, sin_half_latitude = coordinate_table['Cos_Half_Latitude'], coordinate_table['Sin_Half_Latitude']
+    if rows is not None:
+        latitude, longitude, cos_half_latitude, sin_half_latitude = latitude[rows], longitude[rows], cos_half_latitude[rows], sin_half_latitude[rows]
 
-        coordinate_total_hypotenuse = find_hypotenuse(c_1=centroid_coordinates, c_2=city_coordinates)
+    # Calculate Differences For Latitude & Longitude
+    lat_difference = np.abs(latitude[:, None] - anchor_coordinates[:, 0]) * miles_per_degree_lat
+    average_latitude_cos = cos_half_latitude[:, None] * np.cos(anchor_half_latitude_radians) - sin_half_latitude[:, None] * np.sin(anchor_half_latitude_radians)
+    miles_per_degree_lng = average_latitude_cos * miles_per_degree_lat
+    lng_difference = np.abs(longitude[:, None] - anchor_coordinates[:, 1]) * miles_per_degree_lng
 
-        if coordinate_total_hypotenuse <= radius_distance:
-            city_results_list.append(city)
+    # Calculate Distance w/ Pythagorean theorem
+    distance = np.sqrt(lat_difference ** 2 + lng_difference ** 2)
 
-    return city_results_list
+    return distance[:, 0] if single_anchor else distance
 
+def find_search_center(*args):
+    # Set Centriod Coordinates
+    if len(args) == 3:
+        return find_centroid(c_1=args[0], c_2=args[1], c_3=args[2])
+    elif len(args) == 2:
+        return find_centroid(c_1=args[0], c_2=args[1])
+    return args[0]
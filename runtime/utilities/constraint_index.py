@@ -0,0 +1,155 @@
+import numpy as np
+from runtime.utilities.rank_codes import area_classification_codes
+from runtime.utilities.scoring_utilities import has_value, weather_feature_columns
+"""
+    ## Constraint Index
+    - Hard Constraints Exclude Cities Before Scoring, Instead of Only Lowering Their Scores
+    - Numeric Fields are Kept as Sorted Arrays, so Range Constraints are a Binary Search
+    - Area Classifications are Kept as a Row List per Code
+    - Zipcode Prefix Temperatures are Kept as Sorted Arrays w/ the Cities per Zipcode Prefix
+
+    Every Constraint is Counted First, w/o Touching the Cities. The Most Selective Constraint Produces the Candidate Rows
+    & Each Following Constraint, from the Most to the Least Selective, Only Tests the Remaining Candidates.
+
+    Hard Constraints (Profile Key 'hard_constraints'):
+        'Affordable': True                       Exclude Cities w/ the Afforability Warning (See affordability_warning_mask)
+        'Median_Home_Value': [Low, High]         Inclusive Range. Either End may be None. Cities Missing the Value are Excluded
+        'Median_Household_Income': [Low, High]
+        'Area_Classification': ['Urban', 'Hyper Urban']
+        'Min_Temperature': [Low, High]           Zipcode Prefix Yearly Low, e.g. [30, None] for Winter Lows Above 30°F
+        'Max_Temperature': [Low, High]           Zipcode Prefix Yearly High
+"""
+range_fields = ['Median_Home_Value', 'Median_Household_Income']
+temperature_fields = ['Min_Temperature', 'Max_Temperature']
+
+
+class SortedField():
+
+    def __init__(self, values: np.ndarray, valid: np.ndarray):
+        # Rows w/ a Value, Ordered by the Value
+        self.values = values
+        self.valid = valid
+        valid_rows = np.flatnonzero(valid)
+        self.order = valid_rows[np.argsort(values[valid_rows], kind='stable')]
+        self.sorted_values = values[self.order]
+
+    def range_positions(self, low: float = None, high: float = None):
+        # Positions of the Inclusive Range in the Sorted Values
+        start = 0 if low is None else int(np.searchsorted(self.sorted_values, low, side='left'))
+        end = len(self.sorted_values) if high is None else int(np.searchsorted(self.sorted_values, high, side='right'))
+        return start, max(start, end)
+
+    def range_test(self, rows: np.ndarray, low: float = None, high: float = None):
+        values = self.values[rows]
+        mask = self.valid[rows].copy()
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+class ConstraintIndex():
+
+    def __init__(self, zipcode_columns: dict, zipcode_prefix_weather_matrix: np.ndarray):
+        self.zipcode_prefix_index = zipcode_columns['Zipcode_Prefix_Index']
+        self.city_quantity = len(self.zipcode_prefix_index)
+
+        # ---- Median Home Value & Household Income ----
+        self.range_fields = {field: SortedField(zipcode_columns[field], ~np.isnan(zipcode_columns[field])) for field in range_fields}
+
+        # ---- Affordability ----
+        # Lower Bound of the Home Value Band. Cities Missing the Home Value or Deviation Never Get the Warning
+        median_home_value, mad_home_value = zipcode_columns['Median_Home_Value'], zipcode_columns['MAD_Home_Value']
+        home_value_band = has_value(median_home_value) & has_value(mad_home_value)
+        self.lower_home_value = SortedField(median_home_value - mad_home_value, home_value_band)
+        self.unbanded_rows = np.flatnonzero(~home_value_band)
+
+        # ---- Area Classification ----
+        self.area_classification = zipcode_columns['Area_Classification']
+        self.area_classification_rows = {code: np.flatnonzero(self.area_classification == code) for code in area_classification_codes.values()}
+
+        # ---- Zipcode Prefix Temperatures ----
+        # Cities Grouped by Zipcode Prefix, so the Cities of Matching Zipcode Prefixes are Counted w/o a Pass over the Cities
+        self.zipcode_prefix_quantity = np.bincount(self.zipcode_prefix_index, minlength=len(zipcode_prefix_weather_matrix))
+        self.zipcode_prefix_rows = np.argsort(self.zipcode_prefix_index, kind='stable')
+        self.zipcode_prefix_starts = np.concatenate([[0], np.cumsum(self.zipcode_prefix_quantity)])
+        self.temperature_fields = {field: SortedField(zipcode_prefix_weather_matrix[:, weather_feature_columns.index(field)], self.zipcode_prefix_quantity > 0) for field in temperature_fields}
+
+    # -------------- Constraints -------------------
+    # Each Constraint is (Matching Cities, Candidate Rows Function, Test Function)
+    def range_constraint(self, field: str, low: float, high: float):
+        sorted_field = self.range_fields[field]
+        start, end = sorted_field.range_positions(low, high)
+        return end - start, lambda: np.sort(sorted_field.order[start:end]), lambda rows: sorted_field.range_test(rows, low, high)
+
+    def affordable_constraint(self, user_home_price: float):
+        # Afforability Warning: Home Price Below One Median Absolute Deviation from the Median
+        end = self.lower_home_value.range_positions(None, user_home_price)[1]
+        return (end + len(self.unbanded_rows),
+            lambda: np.sort(np.concatenate([self.lower_home_value.order[:end], self.unbanded_rows])),
+            lambda rows: ~self.lower_home_value.valid[rows] | (self.lower_home_value.values[rows] <= user_home_price))
+
+    def area_classification_constraint(self, area_classifications: list):
+        codes = [area_classification_codes[area_classification] for area_classification in area_classifications]
+        return (sum(len(self.area_classification_rows[code]) for code in codes),
+            lambda: np.sort(np.concatenate([self.area_classification_rows[code] for code in codes])),
+            lambda rows: np.isin(self.area_classification[rows], codes))
+
+    def temperature_constraint(self, field: str, low: float, high: float):
+        sorted_field = self.temperature_fields[field]
+        start, end = sorted_field.range_positions(low, high)
+        zipcode_prefixes = sorted_field.order[start:end]
+        zipcode_prefix_mask = np.zeros(len(self.zipcode_prefix_quantity), dtype=bool)
+        zipcode_prefix_mask[zipcode_prefixes] = True
+        return (int(self.zipcode_prefix_quantity[zipcode_prefixes].sum()),
+            lambda: np.sort(np.concatenate([self.zipcode_prefix_rows[self.zipcode_prefix_starts[zipcode_prefix]:self.zipcode_prefix_starts[zipcode_prefix + 1]] for zipcode_prefix in zipcode_prefixes] or [np.array([], dtype=np.int64)])),
+            lambda rows: zipcode_prefix_mask[self.zipcode_prefix_index[rows]])
+
+    def rows_constraint(self, rows: np.ndarray):
+        # Rows Already Selected, e.g. the Search Radius
+        row_mask = np.zeros(self.city_quantity, dtype=bool)
+        row_mask[rows] = True
+        return len(rows), lambda: np.sort(rows), lambda candidate_rows: row_mask[candidate_rows]
+
+    def constraints(self, hard_constraints: dict, user_home_price: float):
+        constraints = []
+        for field, value in hard_constraints.items():
+            if value is None or value is False or value == []:
+                continue
+            elif field == 'Affordable':
+                constraints.append(self.affordable_constraint(user_home_price))
+            elif field in self.range_fields:
+                constraints.append(self.range_constraint(field, *range_bounds(value)))
+            elif field == 'Area_Classification':
+                constraints.append(self.area_classification_constraint([value] if isinstance(value, str) else value))
+            elif field in self.temperature_fields:
+                constraints.append(self.temperature_constraint(field, *range_bounds(value)))
+            else:
+                raise ValueError(f'Unknown Hard Constraint: {field}')
+        return constraints
+
+    def filter_rows(self, hard_constraints: dict, user_home_price: float, rows: np.ndarray = None):
+        """
+            Rows of the Cities Satisfying Every Hard Constraint, in Ascending Order
+            Only Rows in the Given Rows are Returned, if Provided
+        """
+        constraints = self.constraints(hard_constraints, user_home_price)
+        if rows is not None and len(rows) < self.city_quantity:
+            constraints.append(self.rows_constraint(rows))
+        if not constraints:
+            return np.arange(self.city_quantity) if rows is None else rows
+
+        # Most Selective First
+        constraints.sort(key=lambda constraint: constraint[0])
+        candidate_rows = constraints[0][1]()
+        for _, _, constraint_test in constraints[1:]:
+            if not len(candidate_rows):
+                break
+            candidate_rows = candidate_rows[constraint_test(candidate_rows)]
+
+        return candidate_rows
+
+def range_bounds(value: list):
+    # [Low, High] w/ None for an Open End
+    low, high = value
+    return (None if low is None else float(low)), (None if high is None else float(high))
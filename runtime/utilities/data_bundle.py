@@ -0,0 +1,228 @@
+import json, csv, mmap, os, struct, threading
+import numpy as np
+from runtime.utilities.scoring_utilities import build_zipcode_columns, build_weather_matrix, build_natural_disaster_codes
+from runtime.utilities.state_abbreviations import states_abbreviation_list
+"""
+    ## Data Bundle
+    - Runtime Data Compiled into a Single Versioned Binary File
+    - Opened w/ mmap. Numeric Columns are Zero-Copy NumPy Views of the File
+    - Each Dataset is Loaded on First Access (See RuntimeData)
+
+    File Layout:
+        Magic (8 Bytes) | Format Version (uint32) | Table of Contents Length (uint32) | Table of Contents (JSON)
+        Sections Aligned to 64 Bytes: Fixed-Width Numeric Columns & String Tables (UTF-8 Data + int64 Offset Index)
+
+    The Bundle is Built from the Ranked Data Files (See runtime/pack_data_bundle.py).
+    The Ranked Data Files are Loaded Instead if the Bundle is Missing, Out of Date, or a Different Format Version.
+"""
+bundle_magic = b'IHLMDATA'
+bundle_format_version = 2
+section_alignment = 64
+
+default_data_bundle_path = './data/data_ranking/ranked_data/Runtime_Data.bundle'
+ranked_data_source_paths = {
+    'Natural_Disaster': './data/data_ranking/ranked_data/State_Natural_Disaster_Rank_Matrix.json',
+    'Weather': './data/data_ranking/ranked_data/Weather_Ranked_Data.json',
+    'Zipcode': './data/data_ranking/ranked_data/Zipcode_Ranked_Data.json',
+    'Zipcode_Coordinates': './data/data_ranking/ranked_data/Zipcode_Coordinates_Data.json',
+    'Zipcode_Prefix_Boundary': './data/data_ranking/ranked_data/Zipcode_Prefix_Boundary_Data.json',
+    'Region_Name': './data/data_sources/USA_Zipcode_3_Digits.csv'
+}
+
+# Column Order of the Zipcode Prefix Boundary Matrix
+boundary_columns = ['North_Boundary', 'South_Boundary', 'East_Boundary', 'West_Boundary']
+
+
+# -------------- Ranked Data Loaders -------------------
+# Each Loader Returns a Dataset: Name -> NumPy Array (Numeric Column) or List of Strings (String Table)
+
+def load_zipcode_coordinate_data(runtime_data):
+    with open(ranked_data_source_paths['Zipcode_Coordinates'], newline='') as f:
+        zipcode_coordinate_data = json.load(f)
+
+    # City Names, States, & Coordinates - Sets the Row Order for Columnar Data
+    merged_zipcode_coordinate_data = [(coordinate_state_index, city) for coordinate_state_index, state_coordinate_list in enumerate(zipcode_coordinate_data.values()) for city in state_coordinate_list]
+
+    return {
+        'City_Names': [[*city.keys()][0] for _, city in merged_zipcode_coordinate_data],
+        'Coordinate_States': [*zipcode_coordinate_data.keys()],
+        'City_State_Index': np.array([coordinate_state_index for coordinate_state_index, _ in merged_zipcode_coordinate_data], dtype=np.int16),
+        'Zipcode_Coordinates': np.array([[*city.values()][0] for _, city in merged_zipcode_coordinate_data], dtype=np.float64)
+    }
+
+def load_zipcode_data(runtime_data):
+    with open(ranked_data_source_paths['Zipcode'], newline='') as f:
+        zipcode_data = json.load(f)
+    zipcode_list = [city_name[-5:] for city_name in runtime_data.dataset('Zipcode_Coordinates')['City_Names']]
+
+    # Columnar Zipcode Data w/ Zipcode Prefix & State Index of Each Row for Broadcasting Weather & Natural Disaster Scores
+    zipcode_columns = build_zipcode_columns(zipcode_data, zipcode_list)
+    zipcode_prefix_list = sorted({zipcode[:3] for zipcode in zipcode_list})
+    zipcode_prefix_index = {zipcode_prefix: index for index, zipcode_prefix in enumerate(zipcode_prefix_list)}
+    zipcode_columns['Zipcode_Prefix_Index'] = np.array([zipcode_prefix_index[zipcode[:3]] for zipcode in zipcode_list], dtype=np.int32)
+
+    state_index = {state: index for index, state in enumerate(states_abbreviation_list.keys())}
+    zipcode_columns['State_Index'] = np.array([state_index[zipcode_data[zipcode]['City'][-2:]] for zipcode in zipcode_list], dtype=np.int32)
+
+    return {
+        'Zipcode_Column_Names': [*zipcode_columns.keys()],
+        **zipcode_columns,
+        'Zipcode_Prefixes': zipcode_prefix_list
+    }
+
+def load_weather_data(runtime_data):
+    with open(ranked_data_source_paths['Weather'], newline='') as f:
+        zipcode_prefix_weather_data = json.load(f)
+
+    # Aligned w/ the Zipcode Prefix List of the Zipcode Data
+    return {
+        'Weather_Matrix': build_weather_matrix(zipcode_prefix_weather_data, runtime_data.dataset('Zipcode')['Zipcode_Prefixes'])
+    }
+
+def load_natural_disaster_data(runtime_data):
+    with open(ranked_data_source_paths['Natural_Disaster'], newline='') as f:
+        state_natural_disaster_data = json.load(f)
+
+    # Aligned w/ the State Abbreviation List
+    natural_disaster_codes, natural_disaster_type_columns = build_natural_disaster_codes(state_natural_disaster_data, [*states_abbreviation_list.values()])
+
+    return {
+        'Disaster_Types': [*natural_disaster_type_columns.keys()],
+        'Natural_Disaster_Codes': natural_disaster_codes
+    }
+
+def load_zipcode_prefix_boundary_data(runtime_data):
+    with open(ranked_data_source_paths['Zipcode_Prefix_Boundary'], newline='') as f:
+        zipcode_prefix_boundary_data = json.load(f)
+
+    return {
+        'Boundary_Prefixes': [*zipcode_prefix_boundary_data.keys()],
+        'Zipcode_Prefix_Boundaries': np.array([[boundary[column] for column in boundary_columns] for boundary in zipcode_prefix_boundary_data.values()], dtype=np.float64)
+    }
+
+def load_region_name_data(runtime_data):
+    with open(ranked_data_source_paths['Region_Name'], newline='') as f:
+        zipcode_prefix_region_names = list(csv.reader(f))
+
+    return {
+        'Region_Prefixes': [row[0] for row in zipcode_prefix_region_names],
+        'Region_Names': [row[1] for row in zipcode_prefix_region_names]
+    }
+
+# Dataset -> Loader. Loaders may Request the Datasets Listed Before Them
+ranked_data_loaders = {
+    'Zipcode_Coordinates': load_zipcode_coordinate_data,
+    'Zipcode': load_zipcode_data,
+    'Weather': load_weather_data,
+    'Natural_Disaster': load_natural_disaster_data,
+    'Zipcode_Prefix_Boundary': load_zipcode_prefix_boundary_data,
+    'Region_Name': load_region_name_data
+}
+
+# -------------- Binary Bundle -------------------
+def aligned_offset(offset: int):
+    return -(-offset // section_alignment) * section_alignment
+
+def write_data_bundle(bundle_path: str, runtime_data):
+    # Encode Each Section & Record its Location & Dataset in the Table of Contents
+    sections = []
+    table_of_contents = {'Datasets': {}, 'Arrays': {}, 'Strings': {}}
+    offset = 0
+    for dataset_name in ranked_data_loaders:
+        dataset = runtime_data.dataset(dataset_name)
+        table_of_contents['Datasets'][dataset_name] = [*dataset.keys()]
+        for name, value in dataset.items():
+            if isinstance(value, np.ndarray):
+                value = np.ascontiguousarray(value)
+                table_of_contents['Arrays'][name] = {'Dtype': value.dtype.str, 'Shape': [*value.shape], 'Offset': offset}
+                section_data = [value.tobytes()]
+            else:
+                encoded_strings = [string.encode('utf-8') for string in value]
+                string_offsets = np.cumsum([0, *map(len, encoded_strings)], dtype=np.int64)
+                table_of_contents['Strings'][name] = {'Count': len(encoded_strings), 'Offsets_Offset': offset, 'Data_Offset': aligned_offset(offset + string_offsets.nbytes)}
+                section_data = [string_offsets.tobytes(), b'\0' * (aligned_offset(offset + string_offsets.nbytes) - offset - string_offsets.nbytes), b''.join(encoded_strings)]
+
+            sections.extend(section_data)
+            section_length = sum(map(len, section_data))
+            sections.append(b'\0' * (aligned_offset(offset + section_length) - offset - section_length))
+            offset = aligned_offset(offset + section_length)
+
+    # Section Offsets are Relative to the Aligned End of the Header
+    encoded_table_of_contents = json.dumps(table_of_contents).encode('utf-8')
+    header = bundle_magic + struct.pack('<II', bundle_format_version, len(encoded_table_of_contents)) + encoded_table_of_contents
+    header += b'\0' * (aligned_offset(len(header)) - len(header))
+
+    # Write to a Temporary File & Replace so a Running Application Never Reads a Partial Bundle
+    with open(f'{bundle_path}.tmp', 'wb') as f:
+        f.write(header)
+        for section in sections:
+            f.write(section)
+    os.replace(f'{bundle_path}.tmp', bundle_path)
+
+class DataBundle():
+
+    def __init__(self, bundle_path: str):
+        """
+            Open the Data Bundle w/ mmap & Read the Table of Contents
+            Sections are Only Read When a Dataset is Requested
+        """
+        with open(bundle_path, 'rb') as f:
+            self.bundle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Check the File Format
+        if self.bundle[:len(bundle_magic)] != bundle_magic:
+            raise ValueError(f'{bundle_path} is not a data bundle')
+        format_version, table_of_contents_length = struct.unpack_from('<II', self.bundle, len(bundle_magic))
+        if format_version != bundle_format_version:
+            raise ValueError(f'{bundle_path} is format version {format_version}, expected {bundle_format_version}')
+        header_length = len(bundle_magic) + 8
+        self.table_of_contents = json.loads(self.bundle[header_length:header_length + table_of_contents_length])
+        self.sections_offset = aligned_offset(header_length + table_of_contents_length)
+
+    def read_dataset(self, dataset_name: str):
+        # Numeric Columns are Read-Only Views of the Mapped File. String Tables are Decoded to Lists
+        dataset = {}
+        for name in self.table_of_contents['Datasets'][dataset_name]:
+            if name in self.table_of_contents['Arrays']:
+                array = self.table_of_contents['Arrays'][name]
+                dataset[name] = np.frombuffer(self.bundle, dtype=np.dtype(array['Dtype']), count=int(np.prod(array['Shape'])), offset=self.sections_offset + array['Offset']).reshape(array['Shape'])
+            else:
+                string_table = self.table_of_contents['Strings'][name]
+                string_offsets = np.frombuffer(self.bundle, dtype=np.int64, count=string_table['Count'] + 1, offset=self.sections_offset + string_table['Offsets_Offset']).tolist()
+                data_offset = self.sections_offset + string_table['Data_Offset']
+                string_data = self.bundle[data_offset:data_offset + string_offsets[-1]]
+                dataset[name] = [string_data[start:end].decode('utf-8') for start, end in zip(string_offsets[:-1], string_offsets[1:])]
+
+        return dataset
+
+def data_bundle_is_current(bundle_path: str):
+    # Bundle Must Exist & be Newer than Each Ranked Data File Present
+    if not bundle_path or not os.path.exists(bundle_path):
+        return False
+    bundle_modified_time = os.path.getmtime(bundle_path)
+    return all(os.path.getmtime(source_path) <= bundle_modified_time for source_path in ranked_data_source_paths.values() if os.path.exists(source_path))
+
+# -------------- Lazy Runtime Data -------------------
+class RuntimeData():
+
+    def __init__(self, bundle_path: str = default_data_bundle_path):
+        # Prefer the Data Bundle, Otherwise Load the Ranked Data Files
+        self.data_bundle = None
+        if data_bundle_is_current(bundle_path):
+            try:
+                self.data_bundle = DataBundle(bundle_path)
+            except (ValueError, KeyError, OSError):
+                pass
+
+        # Loaded Datasets & a Lock per Dataset so Each is Loaded Once Across Threads
+        self.datasets = {}
+        self.dataset_locks = {dataset_name: threading.Lock() for dataset_name in ranked_data_loaders}
+
+    def dataset(self, dataset_name: str):
+        # Load the Dataset on First Access
+        if dataset_name not in self.datasets:
+            with self.dataset_locks[dataset_name]:
+                if dataset_name not in self.datasets:
+                    self.datasets[dataset_name] = self.data_bundle.read_dataset(dataset_name) if self.data_bundle else ranked_data_loaders[dataset_name](self)
+
+        return self.datasets[dataset_name]
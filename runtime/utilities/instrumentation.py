@@ -0,0 +1,152 @@
+import json, math, os, threading, time
+from collections import deque
+from functools import wraps
+"""
+    ## Instrumentation
+    - Opt-in Timing Spans & Counters for the Scoring Stages
+    - Disabled by Default. A Disabled Span is a Shared No-op, so the Cost is One Attribute Check
+
+    Enable w/ the Environment Variable IDEAL_HOME_INSTRUMENTATION=<Path of a JSON Lines File>
+    or Pass Instrumentation(enabled=True) to IdealHomeDataAnalysis.
+
+    Each Finished Span is Recorded as:
+        {'Span': Name, 'Parent': Enclosing Span Name, 'Start': Epoch Seconds, 'Duration_ms': Wall Time, 'Thread': Thread Name, **Fields}
+    Counters (e.g. Cache Hits & Misses) Accumulate Until Reset. When an Export Path is Set,
+    the Spans are Appended to the File Each Time a Top Level Span Finishes & are Then Dropped.
+    The Summary Covers Only the Most Recent Spans (max_records), so a Long Session Never Grows Memory.
+"""
+
+class NullSpan():
+    # Returned While Disabled
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **fields):
+        pass
+
+null_span = NullSpan()
+
+class Span():
+
+    def __init__(self, instrumentation, name: str, fields: dict):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        span_stack = self.instrumentation.span_stack()
+        self.parent = span_stack[-1].name if span_stack else None
+        span_stack.append(self)
+        self.start_time = time.time()
+        self.start_counter = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start_counter
+        span_stack = self.instrumentation.span_stack()
+        span_stack.pop()
+        self.instrumentation.record({'Span': self.name, 'Parent': self.parent, 'Start': self.start_time, 'Duration_ms': duration * 1000,
+            'Thread': threading.current_thread().name, **self.fields}, top_level=not span_stack)
+        return False
+
+    def set(self, **fields):
+        # Attach Values Known Only Inside the Span (e.g. Number of Cities Scored)
+        self.fields.update(fields)
+
+class Instrumentation():
+
+    def __init__(self, enabled: bool = None, export_path: str = None, max_records: int = 10000):
+        environment_path = os.environ.get('IDEAL_HOME_INSTRUMENTATION')
+        self.enabled = bool(environment_path) if enabled is None else enabled
+        self.export_path = export_path or environment_path
+        self.max_records = max_records
+        self.records = deque(maxlen=max_records)
+        self.counters = {}
+        self.unexported_records = []
+        self.lock = threading.Lock()
+        self.thread_state = threading.local()
+
+    def span_stack(self):
+        if not hasattr(self.thread_state, 'span_stack'):
+            self.thread_state.span_stack = []
+        return self.thread_state.span_stack
+
+    def span(self, name: str, **fields):
+        if not self.enabled:
+            return null_span
+        return Span(self, name, fields)
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            with self.lock:
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, span_record: dict, top_level: bool):
+        with self.lock:
+            self.records.append(span_record)
+            if not self.export_path:
+                return
+            # Nested Spans Wait for the Top Level Span, Then are Exported Together & Dropped
+            self.unexported_records.append(span_record)
+            if top_level:
+                self.export_json_lines(self.export_path, self.unexported_records)
+                self.unexported_records = []
+
+    def reset(self):
+        with self.lock:
+            self.records = deque(maxlen=self.max_records)
+            self.counters = {}
+            self.unexported_records = []
+
+    def export_json_lines(self, path: str, records: list = None):
+        # Append Span Records, One JSON Object per Line
+        with open(path, 'a') as f:
+            for span_record in self.records if records is None else records:
+                f.write(json.dumps(span_record, default=str) + '\n')
+
+    def summary(self):
+        """
+            Span Name -> Calls, Total, Mean, P95, & Max Milliseconds of the Most Recent Spans, Plus the Counters
+        """
+        span_durations = {}
+        for span_record in self.records:
+            span_durations.setdefault(span_record['Span'], []).append(span_record['Duration_ms'])
+
+        span_summary = {}
+        for name, durations in span_durations.items():
+            durations = sorted(durations)
+            span_summary[name] = {
+                'Calls': len(durations),
+                'Total_ms': sum(durations),
+                'Mean_ms': sum(durations) / len(durations),
+                'P95_ms': durations[max(0, math.ceil(len(durations) * 0.95) - 1)],
+                'Max_ms': durations[-1]
+            }
+
+        return {'Spans': span_summary, 'Counters': dict(self.counters)}
+
+    def summary_table(self):
+        summary = self.summary()
+        lines = [f"{'Span':<40}{'Calls':>8}{'Total ms':>12}{'Mean ms':>10}{'P95 ms':>10}{'Max ms':>10}"]
+        for name, span_summary in sorted(summary['Spans'].items(), key=lambda item: -item[1]['Total_ms']):
+            lines.append(f"{name:<40}{span_summary['Calls']:>8}{span_summary['Total_ms']:>12.3f}{span_summary['Mean_ms']:>10.3f}{span_summary['P95_ms']:>10.3f}{span_summary['Max_ms']:>10.3f}")
+        for name, value in sorted(summary['Counters'].items()):
+            lines.append(f'{name:<40}{value:>8}')
+        return '\n'.join(lines)
+
+def instrumented(span_name: str):
+    """
+        Wrap an IdealHomeDataAnalysis Method in a Span of its Instrumentation
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.instrumentation.enabled:
+                return method(self, *args, **kwargs)
+            with self.instrumentation.span(span_name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
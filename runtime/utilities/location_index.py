@@ -0,0 +1,152 @@
+import re
+from functools import lru_cache
+from collections import Counter
+from runtime.utilities.state_abbreviations import states_abbreviation_list
+"""
+    ## Location Index
+    - Resolves a State, City, or Zipcode Entry to a Zipcode Coordinate Entry
+
+    Lookup Order:
+    1. Zipcode: Binary Search of the Zipcode Record Store (See Zipcode Records). No State Required
+    2. City: Normalized Exact Lookup of the Primary City Names, then the Common City Names (Aliases)
+    3. City: Fuzzy Match over a Bounded Candidate Set Pre-filtered by Trigrams
+
+    Repeated Queries are Served from an LRU Cache. Cached Coordinates are Tuples, so Callers Sharing the Index Never Change Them.
+"""
+
+def normalize_name(name: str):
+    # Lowercase, Remove Punctuation, & Collapse Whitespace
+    return ' '.join(re.sub(r'[^a-z0-9 ]', ' ', name.lower()).split())
+
+def name_trigrams(name: str):
+    padded_name = f'  {name} '
+    return {padded_name[i:i + 3] for i in range(len(padded_name) - 2)}
+
+class LocationIndex():
+
+    def __init__(self, zipcode_records, city_state_list: list, max_fuzzy_candidates: int = 50, cache_size: int = 1024):
+        # Zipcode -> Row Lookups, City Strings, & Coordinates by Row Come from the Zipcode Record Store. States by Row (See Data Bundle)
+        self.zipcode_records = zipcode_records
+        self.city_state_list = city_state_list
+        self.max_fuzzy_candidates = max_fuzzy_candidates
+        self.state_names = [*states_abbreviation_list.values()]
+
+        # Per State City Strings & Normalized Name Maps: Name -> List of City Strings in Original Order
+        self.state_city_names = {}
+        self.state_primary_names = {}
+        self.state_alias_names = {}
+        for city_name, state in zip(zipcode_records.city_name_list, city_state_list):
+            if state not in self.state_city_names:
+                self.state_city_names[state] = []
+                self.state_primary_names[state] = {}
+                self.state_alias_names[state] = {}
+            common_city_names = city_name.split(', ')[:-1]
+            self.state_city_names[state].append(city_name)
+            self.state_primary_names[state].setdefault(normalize_name(common_city_names[0]), []).append(city_name)
+            for common_city_name in common_city_names[1:]:
+                self.state_alias_names[state].setdefault(normalize_name(common_city_name), []).append(city_name)
+
+        # Trigram Index Built per State on First Fuzzy Match
+        self.state_trigram_index = {}
+
+        # Cached Entry Points
+        self.resolve_state = lru_cache(maxsize=64)(self.match_state)
+        self.resolve_location = lru_cache(maxsize=cache_size)(self.match_location)
+
+    def match_state(self, state: str):
+        # Check Full State Name Provided
+        if state in self.state_names:
+            return state
+        # Check Abbreviated State Name Provided
+        elif state.upper() in states_abbreviation_list:
+            return states_abbreviation_list[state.upper()]
+
+        # Deferred Import, Most Entries Match Without Fuzzy Matching
+        from thefuzz import process
+        result = process.extractOne(state, self.state_names)
+        if int(result[1]) > 90:
+            return result[0]
+
+        return None
+
+    def match_location(self, state: str = '', city: str = '', zipcode: str = ''):
+        """
+            Returns (Result String, Coordinates Tuple) or (Error Message, None)
+        """
+        # Return if Data Missing
+        if not state and not zipcode:
+            return 'Provide State', None
+        if not city and not zipcode:
+            return 'Provide City or Zipcode', None
+
+        # Prioritize Zipcode Due to Less Likely Typo
+        if zipcode:
+            row = self.zipcode_records.row(zipcode)
+            if row is None:
+                return 'Please Provide Valid Zipcode', None
+            zipcode_state, state_city_name = self.city_state_list[row], self.zipcode_records.city_name_list[row]
+            # State is Optional, but Must Match the Zipcode if Provided
+            if state and self.resolve_state(state) != zipcode_state:
+                if not self.resolve_state(state):
+                    return 'Please Provide Valid US State', None
+                return 'Please Provide Valid Zipcode', None
+
+            return f"{state_city_name.split(', ')[0]}, {zipcode_state} {zipcode}", tuple(self.zipcode_records.zipcode_coordinates[row].tolist())
+
+        state = self.resolve_state(state)
+        if not state:
+            return 'Please Provide Valid US State', None
+
+        # Normalized Exact Match of Primary City Names, then Common City Names
+        normalized_city = normalize_name(city)
+        if normalized_city in self.state_primary_names[state]:
+            state_city_name = self.state_primary_names[state][normalized_city][0]
+            primary_city_result = state_city_name.split(', ')[0]
+        elif normalized_city in self.state_alias_names[state]:
+            state_city_name = self.state_alias_names[state][normalized_city][0]
+            primary_city_result = next(common_city for common_city in state_city_name.split(', ')[:-1] if normalize_name(common_city) == normalized_city)
+        else:
+            state_city_name, primary_city_result = self.fuzzy_match_city(state, city)
+
+        # Matched City Zipcode
+        zipcode = state_city_name[-5:]
+        row = self.zipcode_records.row(zipcode)
+
+        return f'{primary_city_result}, {state} {zipcode}', tuple(self.zipcode_records.zipcode_coordinates[row].tolist())
+
+    def fuzzy_match_city(self, state: str, city: str):
+        from thefuzz import process
+        # Candidate City Strings Sharing the Most Trigrams with the City Entry
+        candidate_city_names = self.trigram_candidates(state, normalize_name(city)) or self.state_city_names[state]
+
+        # Fuzzy Match City
+        city_result = process.extract(city, candidate_city_names)
+        primary_city_list = [city_str[0].split(', ')[0] for city_str in city_result]
+        primary_city_result = process.extract(city, primary_city_list)
+
+        # Compare Primary City with Common City Names
+        if city_result[0][1] >= primary_city_result[0][1]:
+            state_city_name = city_result[0][0]
+            common_city_names = state_city_name.split(', ')
+            primary_city_result = process.extract(city, common_city_names)[0][0]
+        else:
+            primary_city_result = primary_city_result[0][0]
+            state_city_name = city_result[primary_city_list.index(primary_city_result)][0]
+
+        return state_city_name, primary_city_result
+
+    def trigram_candidates(self, state: str, normalized_city: str):
+        if state not in self.state_trigram_index:
+            # Trigram -> Positions of City Strings in the State
+            trigram_index = {}
+            for position, city_name in enumerate(self.state_city_names[state]):
+                for trigram in name_trigrams(normalize_name(city_name[:-7])):
+                    trigram_index.setdefault(trigram, []).append(position)
+            self.state_trigram_index[state] = trigram_index
+
+        trigram_index = self.state_trigram_index[state]
+        shared_trigrams = Counter(position for trigram in name_trigrams(normalized_city) for position in trigram_index.get(trigram, []))
+        # Keep Original Order Among the Bounded Candidate Set
+        candidate_positions = sorted(position for position, _ in shared_trigrams.most_common(self.max_fuzzy_candidates))
+
+        return [self.state_city_names[state][position] for position in candidate_positions]
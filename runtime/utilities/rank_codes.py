@@ -0,0 +1,46 @@
+"""
+    ## Rank Codes
+    - Ordinal Codes for the Ranked Data Labels
+    - Emitted by the Data Ranking Stage & Used by the Runtime Scoring
+
+    Codes Increase with the Ranked Value. Missing or Unknown Labels use the Missing Code (-1).
+"""
+missing_rank_code = -1
+
+# Median Ranking Labels (See Data Ranking Functions)
+median_rank_codes = {
+    'Well Below Average': 0,
+    'Below Average': 1,
+    'Average': 2,
+    'Above Average': 3,
+    'Well Above Average': 4
+}
+
+# Mean Ranking Labels for Zipcode Data (See Data Ranking Functions)
+skewed_rank_codes = {
+    'Not Exceptable': 0,
+    'Exceptable': 1,
+    'Good': 2,
+    'Very Good': 3
+}
+
+# Mean Ranking Labels for Natural Disaster Data (See Data Ranking Functions)
+natural_disaster_rank_codes = {
+    'No Risk': 0,
+    'Low': 1,
+    'Moderate': 2,
+    'High': 3
+}
+
+# Area Classification Labels (See Zipcode Data Processor)
+area_classification_codes = {
+    'Hyper Rural': 0,
+    'Rural': 1,
+    'Suburban': 2,
+    'Urban': 3,
+    'Hyper Urban': 4
+}
+
+def encode_rank(label: str, rank_codes: dict):
+    # Unknown or Missing Labels Return the Missing Code
+    return rank_codes.get(label, missing_rank_code)
@@ -0,0 +1,212 @@
+import numpy as np
+from runtime.utilities.rank_codes import missing_rank_code, median_rank_codes, skewed_rank_codes, area_classification_codes, encode_rank
+"""
+    ## Scoring Utilities
+    - Columnar Zipcode Data & Vectorized Score Functions for the Data Analysis Class
+
+    Each Zipcode Metric is Stored as a NumPy Array Indexed by Row.
+    Rank Labels are Stored as Ordinal Codes (See Rank Codes). Missing Values use the Missing Code (-1) or NaN.
+    Score Tables are Built so the Missing Code (-1) Indexes the Final Entry of the Table.
+"""
+numeric_columns = ['Median_Home_Value', 'MAD_Home_Value', 'Median_Household_Income', 'MAD_Household_Income', 'Travel_Time_To_Work', 'Education_Score']
+median_rank_columns = ['Married_Percentage', 'Families_with_Children', 'School_Enrollment_Percentage', 'Employment_Percentage', 'Motor_Vehicle_Work_Percentage']
+skewed_rank_columns = ['Public_Transportation_Work_Percentage', 'Walking_Biking_Work_Percentage']
+
+
+def rank_code(record: dict, column: str, rank_codes: dict):
+    # Use the Code Emitted by the Data Ranking Stage, Otherwise Encode the Label
+    code = record.get(f'{column}_Code')
+    return code if code is not None else encode_rank(record[column], rank_codes)
+
+def build_zipcode_columns(zipcode_data: dict, zipcode_list: list):
+    """
+        Convert the Zipcode Data Dictionary to Columnar Arrays
+        Row Order Follows the Provided Zipcode List
+    """
+    records = [zipcode_data[zipcode] for zipcode in zipcode_list]
+
+    zipcode_columns = {}
+    # Numeric Metrics - None Stored as NaN
+    for column in numeric_columns:
+        zipcode_columns[column] = np.array([record[column] if record[column] is not None else np.nan for record in records], dtype=np.float64)
+
+    # Ranked Metrics - Labels Stored as Ordinal Codes
+    for column in median_rank_columns:
+        zipcode_columns[column] = np.array([rank_code(record, column, median_rank_codes) for record in records], dtype=np.int8)
+    for column in skewed_rank_columns:
+        zipcode_columns[column] = np.array([rank_code(record, column, skewed_rank_codes) for record in records], dtype=np.int8)
+    zipcode_columns['Area_Classification'] = np.array([rank_code(record, 'Area_Classification', area_classification_codes) for record in records], dtype=np.int8)
+
+    return zipcode_columns
+
+def has_value(column: np.ndarray):
+    # Matches Truth Testing of the Original Values: None & Zero are Both Missing
+    return ~np.isnan(column) & (column != 0)
+
+def rank_score_table(scoring_order: list, missing_score: float):
+    # Missing Code (-1) Selects the Appended Missing Score
+    return np.array([*scoring_order, missing_score], dtype=np.float64)
+
+def deviation_band_score(user_value: float, median_column: np.ndarray, mad_column: np.ndarray):
+    """
+        10 Points: Within Half of a Median Absolute Deviation
+        5 Points: Within One Median Absolute Deviation
+        0 Points: Outside One Median Absolute Deviation or Missing Data
+    """
+    whole_mad_positive = median_column + mad_column
+    half_mad_positive = median_column + mad_column * 0.5
+    half_mad_negative = median_column - mad_column * 0.5
+    whole_mad_negative = median_column - mad_column
+
+    score = np.select(
+        [(half_mad_negative <= user_value) & (user_value <= half_mad_positive), (whole_mad_negative <= user_value) & (user_value <= whole_mad_positive)],
+        [10.0, 5.0], default=0.0)
+
+    return np.where(has_value(median_column) & has_value(mad_column), score, 0.0)
+
+def affordability_warning_mask(user_home_price: float, median_column: np.ndarray, mad_column: np.ndarray):
+    # Home Price Below One Median Absolute Deviation from the Median
+    return has_value(median_column) & has_value(mad_column) & (user_home_price < median_column - mad_column)
+
+def commute_score(user_commute_time: int, commute_column: np.ndarray):
+    commute_time_difference = user_commute_time - commute_column
+    score = np.select(
+        [commute_time_difference <= 0, commute_time_difference <= 10, commute_time_difference <= 15, commute_time_difference <= 20],
+        [4.0, 3.0, 2.0, 1.0], default=0.0)
+
+    return np.where(has_value(commute_column), score, 0.0)
+
+def education_score(user_education_number: int, education_importance: int, education_column: np.ndarray):
+    education_level_difference = np.abs(education_column - user_education_number)
+    score = np.select(
+        [education_level_difference < 0.5, education_level_difference < 1, education_level_difference < 1.5, education_level_difference < 2],
+        [1 * education_importance, 0.75 * education_importance, 0.5 * education_importance, 0.25 * education_importance], default=0.0)
+
+    return np.where(has_value(education_column), score, 0.0)
+
+# User Selected Precipitation & Sunshine Levels as Median Rank Codes
+weather_level_codes = {'Very Low': 0, 'Low': 1, 'Average': 2, 'High': 3, 'Very High': 4}
+
+# Precipitation & Sunshine Score by [User Level Code][Zipcode Prefix Rank Code]
+# Exact Level: 4 Points, Adjacent Level: 2 Points. The Outer 'Well' Levels Only Score an Exact Match.
+ordinal_level_scores = np.array([
+    [4, 0, 0, 0, 0, 0],
+    [2, 4, 2, 0, 0, 0],
+    [0, 2, 4, 2, 0, 0],
+    [0, 0, 2, 4, 2, 0],
+    [0, 0, 0, 0, 4, 0]
+], dtype=np.float64)
+
+# Weather Ranked Data Features - Columns of the Weather Matrix
+weather_feature_columns = ['Average_Temperature', 'Min_Temperature', 'Max_Temperature', 'Seasons', 'Yearly_Precipitation_Code', 'Yearly_Sunshine_Code']
+
+# Season Score by [Zipcode Prefix Seasons] for Each User Selected Seasons
+season_score_tables = {
+    '4 Seasons': np.array([0, 0, 2, 0, 4], dtype=np.float64),
+    '2 Seasons': np.array([2, 2, 4, 2, 2], dtype=np.float64),
+    '1 Season': np.array([0, 4, 2, 0, 0], dtype=np.float64)
+}
+
+def build_weather_matrix(weather_data: dict, zipcode_prefix_list: list):
+    """
+        Convert the Weather Ranked Data to a Dense Zipcode Prefix x Feature Matrix
+        Row Order Follows the Provided Zipcode Prefix List. Column Order Follows weather_feature_columns
+    """
+    return np.array([[weather_data[zipcode_prefix][column] for column in weather_feature_columns] for zipcode_prefix in zipcode_prefix_list], dtype=np.float64)
+
+def temperature_score(temperature_difference: np.ndarray):
+    """
+        3 Points: Within 5 Degrees
+        2 Points: Within 10 Degrees
+        1 Point: Within 15 Degrees
+    """
+    temperature_difference = np.abs(temperature_difference)
+    return np.select([temperature_difference <= 5, temperature_difference <= 10, temperature_difference <= 15], [3.0, 2.0, 1.0], default=0.0)
+
+def weather_score(weather_matrix: np.ndarray, seasons: str, summer_temperature: float, winter_temperature: float, precipitation_code: int, sunshine_code: int):
+    # Weather Score of Every Zipcode Prefix in the Weather Matrix
+    average_temperature, min_temperature, max_temperature, zipcode_seasons, precipitation_column, sunshine_column = weather_matrix.T
+
+    # Seasons & Temperature Scores
+    season_score = season_score_tables.get(seasons, season_score_tables['1 Season'])[zipcode_seasons.astype(np.intp)]
+    if seasons == '4 Seasons':
+        # Average Summer & Winter Selection for Spring / Fall Transition Setpoint
+        transition_temperature = (summer_temperature + winter_temperature) / 2
+        zipcode_temperature_score = temperature_score(max_temperature - summer_temperature) + temperature_score(average_temperature - transition_temperature) + temperature_score(min_temperature - winter_temperature)
+    elif seasons == '2 Seasons':
+        zipcode_temperature_score = temperature_score(max_temperature - summer_temperature) + temperature_score(min_temperature - winter_temperature)
+    else:
+        zipcode_temperature_score = temperature_score(average_temperature - summer_temperature)
+
+    # Precipitation & Sunshine Score
+    precipitation_score = ordinal_level_scores[precipitation_code][precipitation_column.astype(np.intp)]
+    sunshine_score = ordinal_level_scores[sunshine_code][sunshine_column.astype(np.intp)]
+
+    return season_score + zipcode_temperature_score + precipitation_score + sunshine_score
+
+# Natural Disaster Scores by Rank Code: [Combined & Disaster #1, Disaster #2, Disaster #3]
+natural_disaster_severity_scores = [
+    rank_score_table([1, 0.66, 0.33, 0], 1),
+    rank_score_table([0.66, 0.66, 0.33, 0], 0.66),
+    rank_score_table([0.33, 0.33, 0.33, 0], 0.33)
+]
+natural_disaster_frequency_scores = [
+    rank_score_table([1, 0.75, 0.5, 0.25, 0], 1),
+    rank_score_table([0.75, 0.75, 0.5, 0.25, 0], 0.75),
+    rank_score_table([0.5, 0.5, 0.5, 0.25, 0], 0.5)
+]
+# Score of a Disaster Type w/ No Record in the State: [Combined & Disaster #1, Disaster #2, Disaster #3]
+natural_disaster_no_record_scores = [2, 1.41, 0.83]
+
+def natural_disaster_score_table(position: int):
+    # Combined Score by [Severity Code, Frequency Code]. No Record (Both Codes Missing) Selects the No Record Score
+    score_table = natural_disaster_severity_scores[position][:, None] + natural_disaster_frequency_scores[position][None, :]
+    score_table[-1, -1] = natural_disaster_no_record_scores[position]
+    return score_table
+
+natural_disaster_score_tables = [natural_disaster_score_table(position) for position in range(3)]
+
+def build_natural_disaster_codes(rank_matrix_data: dict, state_names: list):
+    """
+        Convert the Natural Disaster Rank Code Matrix to a State x Disaster Type x (Severity, Frequency) Array
+        Row Order Follows the Provided State Names. A Final No Record Column is Added for Unknown Disaster Types
+        Returns (Rank Code Array, Disaster Type -> Column Index)
+    """
+    state_rows = {state: row for row, state in enumerate(rank_matrix_data['States'])}
+    rank_codes = np.array([rank_matrix_data['Rank_Codes'][state_rows[state]] for state in state_names], dtype=np.int8)
+    no_record_column = np.full((len(state_names), 1, 2), missing_rank_code, dtype=np.int8)
+
+    return np.concatenate([rank_codes, no_record_column], axis=1), {disaster_type: column for column, disaster_type in enumerate(rank_matrix_data['Disaster_Types'])}
+
+def natural_disaster_score(rank_codes: np.ndarray, disaster_type_columns: list, natural_disaster_risk: int):
+    """
+        Natural Disaster Score of Every State in the Rank Code Array
+        Disaster Type Columns: [Combined, Disaster #1, Disaster #2, Disaster #3]
+    """
+    combined_column, *disaster_columns = disaster_type_columns
+    state_score = natural_disaster_score_tables[0][rank_codes[:, combined_column, 0], rank_codes[:, combined_column, 1]] * natural_disaster_risk
+    for position, column in enumerate(disaster_columns):
+        state_score = state_score + natural_disaster_score_tables[position][rank_codes[:, column, 0], rank_codes[:, column, 1]] * natural_disaster_risk
+
+    return state_score
+
+def top_k_indexes(scores: np.ndarray, limit: int, offset: int = 0):
+    """
+        Indexes of the Highest Scores in Descending Order for the Page [offset, offset + limit)
+        Partial Selection w/ argpartition. Ties Keep the Original Order, the Same as a Stable Sort
+    """
+    k = min(offset + limit, len(scores))
+    if k <= offset:
+        return np.array([], dtype=np.int64)
+
+    if k < len(scores):
+        # Every Score Tied with the k-th Highest Score Remains a Candidate
+        threshold = scores[np.argpartition(scores, len(scores) - k)[len(scores) - k]]
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(len(scores))
+
+    # Sort Candidates by Descending Score, then by Original Order
+    candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    return candidates[offset:k]
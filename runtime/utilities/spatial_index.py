@@ -0,0 +1,54 @@
+import numpy as np
+from math import cos, pi, floor
+from runtime.utilities.calculation_utilities import batch_find_hypotenuse, miles_per_degree_lat
+"""
+    ## Spatial Index
+    - Latitude & Longitude Grid Bucket Index for the Zipcode Coordinates
+
+    Built Once When the Data Loads. A Radius Search Only Checks the Cities in the
+    Grid Cells that Intersect the Bounding Box of the Search Circle.
+"""
+
+class ZipcodeGridIndex():
+
+    def __init__(self, coordinate_table: dict, cell_size_degrees: float = 0.25):
+        # Precomputed Coordinate Table (See Calculation Utilities)
+        self.coordinate_table = coordinate_table
+        self.cell_size_degrees = cell_size_degrees
+
+        # Map Each Grid Cell to the Rows Inside the Cell
+        cell_rows = {}
+        for row, (latitude, longitude) in enumerate(zip(coordinate_table['Latitude'].tolist(), coordinate_table['Longitude'].tolist())):
+            cell_rows.setdefault(self.grid_cell(latitude, longitude), []).append(row)
+        self.cell_rows = {cell: np.array(rows, dtype=np.int64) for cell, rows in cell_rows.items()}
+
+    def grid_cell(self, latitude: float, longitude: float):
+        return (floor(latitude / self.cell_size_degrees), floor(longitude / self.cell_size_degrees))
+
+    def radius_search(self, center_coordinates: list, radius_distance: float):
+        """
+            Return (Rows within the Radius of the Center in Row Order, Candidate Cities Checked)
+            Distances use the Flat Earth Approximation of the Batch Distance Kernel
+            Nothing is Written to the Index, so One Index is Shared Across Threads
+        """
+        center_latitude, center_longitude = center_coordinates
+
+        # Bounding Box of the Search Circle in Degrees
+        latitude_span = radius_distance / miles_per_degree_lat
+        # Longitude Degrees are Shortest at the Latitude Furthest from the Equator
+        furthest_latitude = min(max(abs(center_latitude - latitude_span), abs(center_latitude + latitude_span)), 89.9)
+        longitude_span = radius_distance / (cos(furthest_latitude * pi / 180) * miles_per_degree_lat)
+
+        south_cell, west_cell = self.grid_cell(center_latitude - latitude_span, center_longitude - longitude_span)
+        north_cell, east_cell = self.grid_cell(center_latitude + latitude_span, center_longitude + longitude_span)
+
+        # Gather Candidate Rows from the Intersecting Cells
+        candidate_rows = [self.cell_rows[(lat_cell, lng_cell)] for lat_cell in range(south_cell, north_cell + 1) for lng_cell in range(west_cell, east_cell + 1) if (lat_cell, lng_cell) in self.cell_rows]
+        if not candidate_rows:
+            return np.array([], dtype=np.int64), 0
+        candidate_rows = np.sort(np.concatenate(candidate_rows))
+
+        # Check All Candidate Cities in One Call
+        candidate_distances = batch_find_hypotenuse(self.coordinate_table, center_coordinates, rows=candidate_rows)
+
+        return candidate_rows[candidate_distances <= radius_distance], len(candidate_rows)
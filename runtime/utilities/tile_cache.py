@@ -0,0 +1,212 @@
+import math, os, pathlib, sqlite3, threading, time
+from concurrent.futures import ThreadPoolExecutor
+"""
+    ## Tile Cache
+    - Persistent Map Tile Cache Shared Across Sessions (SQLite)
+    - Uses the TkinterMapView Offline Database Tables
+    - Every Tile the Map Widget Loads Goes Through tile_image (See App.request_map_tile), so Downloaded Tiles are Cached
+    - Size Bounded w/ Least Recently Used Eviction
+    - Prefetches the Tiles of a Bounding Box in the Background
+
+    Tile Source (Environment Variable IDEAL_HOME_TILE_SOURCE):
+        URL Template of a Tile Server, Default: https://a.tile.openstreetmap.org/{z}/{x}/{y}.png
+        Local Tile Directory Containing {z}/{x}/{y}.png - The Map Reads the Tile Files Directly, Fully Offline
+    Cache Path (Environment Variable IDEAL_HOME_TILE_CACHE), Default: ~/.ideal_home_location_matcher/map_tiles.db
+"""
+default_tile_server = "https://a.tile.openstreetmap.org/{z}/{x}/{y}.png"
+default_tile_cache_path = os.path.join(os.path.expanduser('~'), '.ideal_home_location_matcher', 'map_tiles.db')
+default_max_cache_bytes = 256 * 1024 * 1024
+tile_size = 256
+
+
+def decimal_to_tile(latitude: float, longitude: float, zoom: int):
+    # Web Mercator Tile Position (Same as the TkinterMapView OSM Coordinates)
+    latitude_radians = math.radians(latitude)
+    n = 2.0 ** zoom
+    return (longitude + 180.0) / 360.0 * n, (1.0 - math.log(math.tan(latitude_radians) + 1 / math.cos(latitude_radians)) / math.pi) / 2.0 * n
+
+def fitting_zoom(top_left: tuple, bottom_right: tuple, width: int, height: int, max_zoom: int = 19):
+    """
+        Zoom Level TkinterMapView.fit_bounding_box Selects for a Map of the Given Size:
+        The Highest Zoom where the Bounding Box Fits Inside the Map
+    """
+    min_zoom = math.ceil(math.log2(math.ceil(width / tile_size)))
+    middle_latitude, middle_longitude = (top_left[0] + bottom_right[0]) / 2, (top_left[1] + bottom_right[1]) / 2
+
+    last_fitting_zoom = min_zoom
+    for zoom in range(min_zoom, max_zoom + 1):
+        middle_x, middle_y = decimal_to_tile(middle_latitude, middle_longitude, zoom)
+        top_left_x, top_left_y = decimal_to_tile(*top_left, zoom)
+        bottom_right_x, bottom_right_y = decimal_to_tile(*bottom_right, zoom)
+        half_width, half_height = width / 2 / tile_size, height / 2 / tile_size
+        if middle_x - half_width < top_left_x and middle_y - half_height < top_left_y and middle_x + half_width > bottom_right_x and middle_y + half_height > bottom_right_y:
+            last_fitting_zoom = zoom
+        else:
+            break
+
+    return last_fitting_zoom
+
+def bounding_box_tiles(top_left: tuple, bottom_right: tuple, zoom: int):
+    # Every Tile Intersecting the Bounding Box
+    top_left_x, top_left_y = decimal_to_tile(*top_left, zoom)
+    bottom_right_x, bottom_right_y = decimal_to_tile(*bottom_right, zoom)
+    return [(zoom, x, y) for x in range(int(top_left_x), int(bottom_right_x) + 1) for y in range(int(top_left_y), int(bottom_right_y) + 1)]
+
+class TileCache():
+
+    def __init__(self, database_path: str = None, tile_source: str = None, max_cache_bytes: int = default_max_cache_bytes, max_prefetch_tiles: int = 256, download_threads: int = 4):
+        self.database_path = database_path or os.environ.get('IDEAL_HOME_TILE_CACHE') or default_tile_cache_path
+        tile_source = tile_source or os.environ.get('IDEAL_HOME_TILE_SOURCE') or default_tile_server
+        self.max_cache_bytes = max_cache_bytes
+        self.max_prefetch_tiles = max_prefetch_tiles
+        self.download_threads = download_threads
+
+        # Local Tile Directory: Tiles are Read from the Directory, Never Cached, & the Map Never Uses the Network
+        self.local_tile_directory = tile_source if os.path.isdir(tile_source) else None
+        self.tile_server = pathlib.Path(tile_source).resolve().as_uri() + '/{z}/{x}/{y}.png' if self.local_tile_directory else tile_source
+        self.offline = self.local_tile_directory is not None
+
+        # Only the Most Recent Prefetch Runs
+        self.prefetch_generation = 0
+        self.prefetch_lock = threading.Lock()
+
+        # Tiles Stored Since the Last Eviction
+        self.stored_tiles = 0
+        self.eviction_interval = 64
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.database_path)), exist_ok=True)
+        with self.connect() as connection:
+            self.create_tables(connection)
+            self.evict_tiles(connection)
+
+    def connect(self):
+        connection = sqlite3.connect(self.database_path, timeout=10)
+        # Map Widget Reads While the Prefetch Writes
+        connection.execute('PRAGMA journal_mode=WAL;')
+        return connection
+
+    def create_tables(self, connection):
+        # Server & Tiles Tables Match the TkinterMapView Offline Database
+        connection.execute('''CREATE TABLE IF NOT EXISTS server (
+                                url VARCHAR(300) PRIMARY KEY NOT NULL,
+                                max_zoom INTEGER NOT NULL);''')
+        connection.execute('''CREATE TABLE IF NOT EXISTS tiles (
+                                zoom INTEGER NOT NULL,
+                                x INTEGER NOT NULL,
+                                y INTEGER NOT NULL,
+                                server VARCHAR(300) NOT NULL,
+                                tile_image BLOB NOT NULL,
+                                CONSTRAINT fk_server FOREIGN KEY (server) REFERENCES server (url),
+                                CONSTRAINT pk_tiles PRIMARY KEY (zoom, x, y, server));''')
+        # Size & Last Access of Each Cached Tile for Eviction
+        connection.execute('''CREATE TABLE IF NOT EXISTS tile_usage (
+                                zoom INTEGER NOT NULL,
+                                x INTEGER NOT NULL,
+                                y INTEGER NOT NULL,
+                                server VARCHAR(300) NOT NULL,
+                                size INTEGER NOT NULL,
+                                last_access REAL NOT NULL,
+                                CONSTRAINT pk_tile_usage PRIMARY KEY (zoom, x, y, server));''')
+        connection.execute('CREATE INDEX IF NOT EXISTS tile_usage_last_access ON tile_usage (last_access);')
+        connection.execute('INSERT OR IGNORE INTO server (url, max_zoom) VALUES (?, ?);', (self.tile_server, 19))
+
+    def load_tile(self, zoom: int, x: int, y: int):
+        # Tile Image Bytes from the Local Tile Directory or the Tile Server. None if Unavailable
+        try:
+            if self.local_tile_directory:
+                with open(os.path.join(self.local_tile_directory, str(zoom), str(x), f'{y}.png'), 'rb') as f:
+                    return f.read()
+            # Deferred Import, Only Needed to Download Tiles
+            import urllib.request
+            url = self.tile_server.replace("{x}", str(x)).replace("{y}", str(y)).replace("{z}", str(zoom))
+            with urllib.request.urlopen(urllib.request.Request(url, headers={"User-Agent": "TkinterMapView"}), timeout=10) as response:
+                return response.read()
+        except OSError:
+            return None
+
+    def tile_image(self, zoom: int, x: int, y: int, connection=None):
+        """
+            Tile Image Bytes for the Map Widget. None if Unavailable
+            Cached Tiles are Marked as Recently Used. Missing Tiles are Downloaded & Cached
+            A Local Tile Directory is Read Directly
+        """
+        if self.offline:
+            return self.load_tile(zoom, x, y)
+
+        # The Map Widget Loads Tiles on its Own Threads, Each w/ its Own Connection
+        if connection is None:
+            connection = self.connect()
+            try:
+                return self.tile_image(zoom, x, y, connection)
+            finally:
+                connection.close()
+
+        cached_tile = connection.execute('SELECT tile_image FROM tiles WHERE zoom=? AND x=? AND y=? AND server=?;', (zoom, x, y, self.tile_server)).fetchone()
+        if cached_tile is not None:
+            connection.execute('UPDATE tile_usage SET last_access=? WHERE zoom=? AND x=? AND y=? AND server=?;', (time.time(), zoom, x, y, self.tile_server))
+            connection.commit()
+            return cached_tile[0]
+
+        tile_image = self.load_tile(zoom, x, y)
+        if tile_image:
+            self.store_tile(connection, zoom, x, y, tile_image)
+        return tile_image
+
+    def prefetch_bounding_box(self, top_left: tuple, bottom_right: tuple, zoom_levels: list):
+        """
+            Cache the Tiles of the Bounding Box at Each Zoom Level in a Background Thread
+            Cached Tiles are Marked as Recently Used. Returns the Thread, or None for a Local Tile Directory
+        """
+        if self.offline:
+            return None
+
+        with self.prefetch_lock:
+            self.prefetch_generation += 1
+            generation = self.prefetch_generation
+
+        tiles = [tile for zoom in zoom_levels for tile in bounding_box_tiles(top_left, bottom_right, zoom)][:self.max_prefetch_tiles]
+        prefetch_thread = threading.Thread(target=self.prefetch_tiles, args=(tiles, generation), name='Prefetch_Tiles', daemon=True)
+        prefetch_thread.start()
+        return prefetch_thread
+
+    def prefetch_tiles(self, tiles: list, generation: int):
+        with self.connect() as connection:
+            # Mark Cached Tiles as Recently Used
+            cached_tiles = {tile for tile in tiles if connection.execute('SELECT 1 FROM tile_usage WHERE zoom=? AND x=? AND y=? AND server=?;', (*tile, self.tile_server)).fetchone()}
+            connection.executemany('UPDATE tile_usage SET last_access=? WHERE zoom=? AND x=? AND y=? AND server=?;', [(time.time(), *tile, self.tile_server) for tile in cached_tiles])
+            connection.commit()
+
+            # Load the Missing Tiles, Stopping Early if a Newer Prefetch Starts
+            missing_tiles = [tile for tile in tiles if tile not in cached_tiles]
+            with ThreadPoolExecutor(max_workers=self.download_threads) as executor:
+                for tile, tile_image in zip(missing_tiles, executor.map(lambda tile: self.load_tile(*tile) if generation == self.prefetch_generation else None, missing_tiles)):
+                    if tile_image:
+                        self.store_tile(connection, *tile, tile_image)
+
+    def store_tile(self, connection, zoom: int, x: int, y: int, tile_image: bytes):
+        connection.execute('INSERT OR REPLACE INTO tiles (zoom, x, y, server, tile_image) VALUES (?, ?, ?, ?, ?);', (zoom, x, y, self.tile_server, tile_image))
+        connection.execute('INSERT OR REPLACE INTO tile_usage (zoom, x, y, server, size, last_access) VALUES (?, ?, ?, ?, ?, ?);', (zoom, x, y, self.tile_server, len(tile_image), time.time()))
+        connection.commit()
+
+        # Evict Every Few Stored Tiles, Not on Each One
+        self.stored_tiles += 1
+        if self.stored_tiles >= self.eviction_interval:
+            self.stored_tiles = 0
+            self.evict_tiles(connection)
+
+    def evict_tiles(self, connection):
+        # Delete the Least Recently Used Tiles Until the Cache is Under the Size Limit
+        total_bytes = connection.execute('SELECT COALESCE(SUM(size), 0) FROM tile_usage;').fetchone()[0]
+        if total_bytes <= self.max_cache_bytes:
+            return
+
+        evicted_tiles = []
+        for zoom, x, y, server, size in connection.execute('SELECT zoom, x, y, server, size FROM tile_usage ORDER BY last_access;').fetchall():
+            if total_bytes <= self.max_cache_bytes:
+                break
+            evicted_tiles.append((zoom, x, y, server))
+            total_bytes -= size
+
+        connection.executemany('DELETE FROM tiles WHERE zoom=? AND x=? AND y=? AND server=?;', evicted_tiles)
+        connection.executemany('DELETE FROM tile_usage WHERE zoom=? AND x=? AND y=? AND server=?;', evicted_tiles)
+        connection.commit()
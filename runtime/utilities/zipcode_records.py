@@ -0,0 +1,104 @@
+import numpy as np
+from runtime.utilities.rank_codes import missing_rank_code
+from runtime.utilities.state_abbreviations import states_abbreviation_list
+"""
+    ## Zipcode Records
+    - Compact Record Store over the Columnar Zipcode Data (See Scoring Utilities). One Typed Array per Field
+    - Zipcode -> Row Lookups are a Binary Search of a Sorted int32 Zipcode Array, not a Hash Map of Strings
+    - Missing Values are NaN (Numeric Fields) or the Missing Code (Ranked Fields). Records Return Them as None
+
+    ZipcodeRecord is a __slots__ Row View for Code that Wants Attribute Access, e.g. record.Median_Home_Value
+    Scoring Reads the Columns Directly. Row Views are for Lookups, Reports, & Debugging
+"""
+record_fields = ['City', 'Zipcode', 'State', 'Coordinates']
+
+
+class ZipcodeRecord():
+
+    # Row Views Hold Only the Store & the Row
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row: int):
+        self.store = store
+        self.row = row
+
+    def __getattr__(self, field: str):
+        # Only Called for Fields, the Slots are Found First
+        if field in ZipcodeRecord.__slots__:
+            raise AttributeError(field)
+        try:
+            return self.store.value(self.row, field)
+        except KeyError:
+            raise AttributeError(f'ZipcodeRecord has no field {field!r}') from None
+
+    def as_dict(self):
+        return {field: self.store.value(self.row, field) for field in self.store.field_names}
+
+    def __repr__(self):
+        return f'ZipcodeRecord({self.Zipcode}, {self.City}, {self.State})'
+
+class ZipcodeRecordStore():
+
+    def __init__(self, zipcode_columns: dict, city_name_list: list, zipcode_coordinates: np.ndarray):
+        # Columns are Shared, Not Copied - Views of the Data Bundle When Loaded from the Bundle
+        self.zipcode_columns = zipcode_columns
+        self.city_name_list = city_name_list
+        self.zipcode_coordinates = zipcode_coordinates
+        self.field_names = [*record_fields, *zipcode_columns.keys()]
+        self.state_list = [*states_abbreviation_list.keys()]
+
+        # Sorted Zipcodes & the Row of Each for Binary Search
+        zipcodes = np.array([city_name[-5:] for city_name in city_name_list], dtype=np.int32)
+        self.zipcode_rows = np.argsort(zipcodes, kind='stable').astype(np.int32)
+        self.sorted_zipcodes = zipcodes[self.zipcode_rows]
+
+    def __len__(self):
+        return len(self.city_name_list)
+
+    def row(self, zipcode: str):
+        # Row of the Zipcode, or None if Not Found
+        if len(zipcode) != 5 or not zipcode.isdigit():
+            return None
+        position = int(np.searchsorted(self.sorted_zipcodes, int(zipcode)))
+        if position < len(self.sorted_zipcodes) and self.sorted_zipcodes[position] == int(zipcode):
+            return int(self.zipcode_rows[position])
+        return None
+
+    def rows(self, zipcode_list: list):
+        # Vectorized Lookup. Rows of Zipcodes Not Found are -1
+        zipcodes = np.array(zipcode_list, dtype=np.int32)
+        positions = np.minimum(np.searchsorted(self.sorted_zipcodes, zipcodes), len(self.sorted_zipcodes) - 1)
+        return np.where(self.sorted_zipcodes[positions] == zipcodes, self.zipcode_rows[positions], -1)
+
+    def record(self, zipcode: str):
+        # Row View of the Zipcode, or None if Not Found
+        row = self.row(zipcode)
+        return ZipcodeRecord(self, row) if row is not None else None
+
+    def record_at(self, row: int):
+        return ZipcodeRecord(self, int(row))
+
+    def missing_mask(self, field: str):
+        # Rows Missing a Value of the Column
+        column = self.zipcode_columns[field]
+        return np.isnan(column) if column.dtype.kind == 'f' else column == missing_rank_code
+
+    def value(self, row: int, field: str):
+        if field == 'City':
+            return self.city_name_list[row].split(', ')[0]
+        elif field == 'Zipcode':
+            return self.city_name_list[row][-5:]
+        elif field == 'State':
+            return self.state_list[self.zipcode_columns['State_Index'][row]]
+        elif field == 'Coordinates':
+            return self.zipcode_coordinates[row].tolist()
+
+        value = self.zipcode_columns[field][row]
+        if self.zipcode_columns[field].dtype.kind == 'f':
+            return None if np.isnan(value) else float(value)
+        return None if value == missing_rank_code else int(value)
+
+    @property
+    def nbytes(self):
+        # Bytes of the Typed Arrays. Shared Columns are Counted, the City Name Strings are Not
+        return sum(column.nbytes for column in self.zipcode_columns.values()) + self.zipcode_coordinates.nbytes + self.sorted_zipcodes.nbytes + self.zipcode_rows.nbytes
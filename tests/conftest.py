@@ -0,0 +1,10 @@
+import pytest
+from runtime.dataset import IdealHomeDataset
+"""
+    Shared Fixtures. Run from the Repository Root, e.g. python -m pytest -q
+"""
+
+@pytest.fixture(scope='session')
+def dataset():
+    # One Loaded Dataset for Every Test
+    return IdealHomeDataset().load()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from runtime.profile_scoring import bounded_score_search, location_radius_rows, profile_home_price, resolve_profile_locations, score_search
+from runtime.scoring_benchmark import benchmark_profiles
+from runtime.utilities.scoring_utilities import top_k_indexes
+"""
+    Branch & Bound Search Must Return the Same Top K as the Exhaustive Search, Tied Scores in the Same Order
+"""
+location_keys = ['family_location', 'family_location2', 'work_location']
+
+
+def search_cases(dataset, radius: bool):
+    # (Profile Index, Selections, Rows) of Each Benchmark Profile, w/ its Search Radius or Every City
+    cases = []
+    for index, profile in enumerate(benchmark_profiles()):
+        if not radius:
+            profile = {key: value for key, value in profile.items() if key not in location_keys}
+        coordinates_list, errors = resolve_profile_locations(dataset, profile)
+        if errors:
+            continue
+        rows, errors = location_radius_rows(dataset, coordinates_list, int(profile['radius_index']))
+        if errors:
+            continue
+        cases.append((index, {**profile, 'affordable_home_price': profile_home_price(profile)}, rows))
+    return cases
+
+def top_k(search_scores: dict, k: int):
+    # Rows & Final City Scores of the Top K
+    indexes = top_k_indexes(search_scores['Final_City_Score'], limit=k)
+    return search_scores['Rows'][indexes].tolist(), search_scores['Final_City_Score'][indexes].tolist()
+
+@pytest.mark.parametrize('radius', [True, False], ids=['radius', 'every_city'])
+@pytest.mark.parametrize('k', [1, 5, 10])
+def test_bounded_matches_exhaustive_top_k(dataset, radius, k):
+    cases = search_cases(dataset, radius)
+    assert cases
+    for index, selections, rows in cases:
+        exhaustive_scores = score_search(dataset, selections, rows)
+        bounded_scores = bounded_score_search(dataset, selections, rows, top_n=k)
+        assert top_k(bounded_scores, k) == top_k(exhaustive_scores, k), f'Benchmark Profile {index}'
+
+def test_bounded_keeps_tied_order(dataset):
+    # Profiles w/ the k-th & (k + 1)-th Best Final City Scores Tied
+    tied_cases = 0
+    for index, selections, rows in search_cases(dataset, radius=True):
+        exhaustive_scores = score_search(dataset, selections, rows)
+        final_city_score = np.sort(exhaustive_scores['Final_City_Score'])[::-1]
+        for k in (1, 5, 10):
+            if len(final_city_score) > k and final_city_score[k - 1] == final_city_score[k]:
+                tied_cases += 1
+                assert top_k(bounded_score_search(dataset, selections, rows, top_n=k), k + 1) == top_k(exhaustive_scores, k + 1), f'Benchmark Profile {index}'
+    assert tied_cases > 0
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from runtime.profile_scoring import location_radius_rows
+from runtime.utilities.rank_codes import area_classification_codes
+from runtime.utilities.scoring_utilities import affordability_warning_mask, has_value, weather_feature_columns
+"""
+    Constraint Index Filters Must Match a Brute Force Mask over Every City
+"""
+hard_constraint_cases = [
+    {'Affordable': True},
+    {'Affordable': False},
+    {'Median_Home_Value': [100000, 250000]},
+    {'Median_Home_Value': [300000, None]},
+    {'Median_Household_Income': [None, 50000]},
+    {'Median_Household_Income': [None, None]},
+    {'Area_Classification': ['Hyper Urban']},
+    {'Area_Classification': 'Suburban'},
+    {'Area_Classification': []},
+    {'Min_Temperature': [30, None]},
+    {'Max_Temperature': [None, 85]},
+    {'Max_Temperature': [70, 90]},
+    {'Min_Temperature': [200, None]},
+    {'Affordable': True, 'Area_Classification': ['Urban', 'Hyper Urban'], 'Min_Temperature': [30, None]},
+    {'Median_Home_Value': [300000, None], 'Median_Household_Income': [90000, None], 'Max_Temperature': [70, 90], 'Area_Classification': ['Suburban']},
+    {'Affordable': False, 'Median_Home_Value': None, 'Min_Temperature': [None, 20]}
+]
+
+
+def brute_force_rows(dataset, hard_constraints: dict, user_home_price: float, rows: np.ndarray):
+    # Test Every City Against Every Constraint
+    zipcode_columns = dataset.zipcode_columns
+    mask = np.zeros(len(dataset.city_name_list), dtype=bool)
+    mask[rows] = True
+    for field, value in hard_constraints.items():
+        if value is None or value is False or value == []:
+            continue
+        if field == 'Affordable':
+            mask &= ~affordability_warning_mask(user_home_price, zipcode_columns['Median_Home_Value'], zipcode_columns['MAD_Home_Value'])
+        elif field == 'Area_Classification':
+            mask &= np.isin(zipcode_columns['Area_Classification'], [area_classification_codes[area_classification] for area_classification in ([value] if isinstance(value, str) else value)])
+        else:
+            if field in weather_feature_columns:
+                column = dataset.zipcode_prefix_weather_matrix[:, weather_feature_columns.index(field)][zipcode_columns['Zipcode_Prefix_Index']]
+            else:
+                column = zipcode_columns[field]
+            low, high = value
+            mask &= ~np.isnan(column)
+            if low is not None:
+                mask &= column >= low
+            if high is not None:
+                mask &= column <= high
+    return np.flatnonzero(mask)
+
+@pytest.fixture(scope='module')
+def search_rows(dataset):
+    # Every City & the Cities Within a Search Radius
+    return {'every_city': np.arange(len(dataset.city_name_list)), 'radius': location_radius_rows(dataset, [[30.26, -97.74], [], []], 4)[0]}
+
+@pytest.mark.parametrize('rows_name', ['every_city', 'radius'])
+@pytest.mark.parametrize('user_home_price', [150000.0, 400000.0])
+@pytest.mark.parametrize('hard_constraints', hard_constraint_cases)
+def test_filter_rows_matches_brute_force(dataset, search_rows, hard_constraints, user_home_price, rows_name):
+    rows = search_rows[rows_name]
+    filtered_rows = dataset.constraint_index.filter_rows(hard_constraints, user_home_price, rows)
+    assert np.array_equal(filtered_rows, brute_force_rows(dataset, hard_constraints, user_home_price, rows))
+
+def test_filter_rows_without_rows(dataset):
+    hard_constraints = {'Affordable': True, 'Min_Temperature': [30, None]}
+    assert np.array_equal(dataset.constraint_index.filter_rows(hard_constraints, 250000.0), brute_force_rows(dataset, hard_constraints, 250000.0, np.arange(len(dataset.city_name_list))))
+
+def test_affordable_keeps_unbanded_rows(dataset):
+    # Cities Missing the Home Value or Deviation Never Get the Afforability Warning
+    zipcode_columns = dataset.zipcode_columns
+    unbanded_rows = np.flatnonzero(~(has_value(zipcode_columns['Median_Home_Value']) & has_value(zipcode_columns['MAD_Home_Value'])))
+    assert len(unbanded_rows)
+    filtered_rows = dataset.constraint_index.filter_rows({'Affordable': True}, 0.0)
+    assert np.isin(unbanded_rows, filtered_rows).all()
+
+def test_affordable_boundary_is_inclusive(dataset):
+    # Home Price Exactly at a City's Lower Band is Affordable
+    zipcode_columns = dataset.zipcode_columns
+    lower_home_value = zipcode_columns['Median_Home_Value'] - zipcode_columns['MAD_Home_Value']
+    row = int(np.nanargmin(np.abs(lower_home_value - 300000.0)))
+    user_home_price = float(lower_home_value[row])
+    filtered_rows = dataset.constraint_index.filter_rows({'Affordable': True}, user_home_price)
+    assert row in filtered_rows
+    assert np.array_equal(filtered_rows, brute_force_rows(dataset, {'Affordable': True}, user_home_price, np.arange(len(dataset.city_name_list))))
+
+def test_unknown_hard_constraint(dataset):
+    with pytest.raises(ValueError, match='Unknown Hard Constraint'):
+        dataset.constraint_index.filter_rows({'Population': [1000, None]}, 250000.0)
@@ -0,0 +1,18 @@
+from runtime.data_analysis import IdealHomeDataAnalysis
+from runtime.profile_scoring import resolve_location
+"""
+    Location Index Cache is Shared by Every Session of the Dataset
+"""
+
+def test_resolved_coordinates_are_not_shared(dataset):
+    result, coordinates = resolve_location(dataset, state='OH', zipcode='44102')
+    assert coordinates is not None
+    coordinates[0] = 0.0
+    assert resolve_location(dataset, state='OH', zipcode='44102') == (result, dataset.zipcode_records.record('44102').Coordinates)
+
+def test_sessions_get_their_own_coordinates(dataset):
+    sessions = [IdealHomeDataAnalysis(dataset=dataset) for _ in range(2)]
+    for session in sessions:
+        session.city_name_zipcode_matcher(state='OH', city='Cleveland')
+    assert sessions[0].saved_coordinates_list[0] == sessions[1].saved_coordinates_list[0]
+    assert sessions[0].saved_coordinates_list[0] is not sessions[1].saved_coordinates_list[0]